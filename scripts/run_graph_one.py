@@ -8,8 +8,10 @@ import uuid
 from pathlib import Path
 from typing import Any, Dict
 
+from src.llm.providers.openai_compat_client import aclose_clients
 from src.observability.artifact_writer import JobRunArtifactWriter
 from src.orch.graph import build_graph
+from src.runtime.loop import install_uvloop
 
 ARTIFACTS_DIR = Path(os.getenv("ARTIFACT_DIR", "data/artifacts")) / "langgraph"
 
@@ -81,10 +83,15 @@ async def main_async(args: argparse.Namespace) -> None:
         },
         "features": {
             "enable_skill_gap": False,
+            "speculative_api": args.speculative_api,
         },
     }
 
-    out = await app.ainvoke(state)
+    try:
+        out = await app.ainvoke(state)
+    finally:
+        # pooled provider connections belong to this loop; close before asyncio.run returns
+        await aclose_clients()
 
     job_dir = Path(args.out_dir) / run_id / args.job_id
     job_dir.mkdir(parents=True, exist_ok=True)
@@ -182,6 +189,11 @@ def main() -> None:
     ap.add_argument("--local-mode", default="chat_lora")
     ap.add_argument("--local-model", default="Qwen/Qwen2.5-0.5B-Instruct")
     ap.add_argument("--local-lora-path", default=None)
+    ap.add_argument(
+        "--speculative-api",
+        action="store_true",
+        help="with --local-first, run the API extraction concurrently as a ready fallback",
+    )
 
     # api
     ap.add_argument("--extract-provider", default="openai", choices=["openai", "nvidia"])
@@ -190,6 +202,7 @@ def main() -> None:
     ap.add_argument("--report-model", default=None)
 
     args = ap.parse_args()
+    install_uvloop()
     asyncio.run(main_async(args))
 
 
@@ -2,17 +2,39 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
 import json
 import os
+import sys
 import time
 from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from src.llm.providers.openai_compat_client import aclose_clients
+from src.llm.providers.openai_compat_providers import PROVIDERS
+from src.runtime.loop import install_uvloop
+
 ARTIFACTS_DIR = Path(os.getenv("ARTIFACT_DIR", "data/artifacts")) / "mcp"
+TOOL_CACHE_DIR = Path(os.getenv("TOOL_CACHE_DIR", "data/cache/tool"))
+
+# Cached tool results expire after these many seconds; tools not listed (qc_validate
+# is cheap) are never cached. Keys hash all tool args, so a different job, prompt_name,
+# provider, model or generation setting misses.
+TOOL_CACHE_TTL_S: Dict[str, int] = {
+    "fetch_jd": 86400,
+    "extract_local": 7 * 86400,
+    "extract_api": 7 * 86400,
+    "generate_report_api": 7 * 86400,
+}
+
+# the only extraction payload fields persisted as meta (structured/raw_output are written apart)
+EXTRACT_META_KEYS = ("parse_ok", "parse_repaired", "usage", "extractor")
 
 
 # ----------------------------
@@ -34,28 +56,29 @@ def _write_json(path: Path, obj: Any) -> None:
     path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
-def _tool_result_text(res: Any) -> str:
-    parts = []
-    for b in getattr(res, "content", []) or []:
+def _tool_result_bytes(res: Any) -> bytes:
+    # text blocks encoded straight into one buffer; orjson parses bytes directly
+    buf = bytearray()
+    for b in getattr(res, "content", None) or ():
         t = getattr(b, "text", None)
         if isinstance(t, str):
-            parts.append(t)
-    return "".join(parts)
+            buf += t.encode("utf-8")
+    return bytes(buf)
 
 
 def _tool_result_json(res: Any, tool_name: str) -> Any:
     if getattr(res, "is_error", False):
-        msg = _tool_result_text(res).strip()
+        msg = _tool_result_bytes(res).decode("utf-8", errors="replace").strip()
         raise RuntimeError(f"Tool {tool_name} failed: {msg or res}")
 
-    txt = _tool_result_text(res).strip()
-    if not txt:
+    data = _tool_result_bytes(res).strip()
+    if not data:
         raise RuntimeError(f"Tool {tool_name} returned empty content: {res}")
 
     try:
-        return json.loads(txt)
-    except json.JSONDecodeError:
-        snippet = txt[:500]
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        snippet = data[:500].decode("utf-8", errors="replace")
         raise RuntimeError(f"Tool {tool_name} returned non-JSON text (first 500 chars): {snippet}")
 
 
@@ -91,6 +114,9 @@ class RunOneConfig:
     # artifacts
     out_dir: Path = ARTIFACTS_DIR
 
+    # reuse tool results from TOOL_CACHE_DIR across runs (dev loops, reruns)
+    tool_cache: bool = False
+
 
 class RunOneMetrics:
     def __init__(self) -> None:
@@ -124,238 +150,354 @@ class RunOneMetrics:
 # ----------------------------
 
 
+SERVER_COMMAND = "python"
+SERVER_ARGS = ("-m", "src.mcp_server.server")
+
+
+@lru_cache(maxsize=1)
+def _server_params() -> StdioServerParameters:
+    # built once: the environment is snapshotted at first use, not copied per spawn
+    return StdioServerParameters(
+        command=SERVER_COMMAND,
+        args=list(SERVER_ARGS),
+        env=os.environ.copy(),
+    )
+
+
+def refresh_server_params() -> None:
+    """
+    Re-snapshot os.environ for the next server spawn (e.g. after setting API keys).
+    """
+    _server_params.cache_clear()
+
+
+def _tool_cache_path(name: str, args: Dict[str, Any]) -> Path:
+    key = hashlib.blake2b(
+        orjson.dumps([name, args], option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+    return TOOL_CACHE_DIR / name / f"{key}.json"
+
+
+def _tool_cache_get(path: Path, ttl_s: int) -> Any:
+    try:
+        if time.time() - path.stat().st_mtime > ttl_s:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _cacheable(name: str, payload: Any) -> bool:
+    # failed extractions/reports are not replayed: a rerun must be able to recover
+    if not isinstance(payload, dict):
+        return False
+    if payload.get("parse_ok") is False:
+        return False
+    if name == "generate_report_api" and not payload.get("report_md"):
+        return False
+    return True
+
+
+def _tool_cache_put(path: Path, payload: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(orjson.dumps(payload))
+    tmp.replace(path)
+
+
+def _api_model(cfg: RunOneConfig) -> str:
+    return cfg.model or PROVIDERS[cfg.provider].default_model
+
+
 async def _call_tool(
-    session: ClientSession, trace: list[dict[str, Any]], name: str, args: Dict[str, Any]
+    session: ClientSession,
+    trace: list[dict[str, Any]],
+    name: str,
+    args: Dict[str, Any],
+    cache: bool = False,
 ) -> Any:
     t0 = time.time()
+    ttl_s = TOOL_CACHE_TTL_S.get(name) if cache else None
+    cache_path = _tool_cache_path(name, args) if ttl_s else None
+    if cache_path is not None:
+        payload = _tool_cache_get(cache_path, ttl_s)
+        if payload is not None:
+            dt = time.time() - t0
+            trace.append(
+                {
+                    "t": _ts(),
+                    "step": name,
+                    "status": "ok",
+                    "cached": True,
+                    "elapsed_s": round(dt, 3),
+                }
+            )
+            return payload, dt
+
     trace.append({"t": _ts(), "step": name, "status": "start", "args_keys": sorted(args.keys())})
     res = await session.call_tool(name, args)
     payload = _tool_result_json(res, name)
+    if cache_path is not None and _cacheable(name, payload):
+        _tool_cache_put(cache_path, payload)
     dt = time.time() - t0
     trace.append({"t": _ts(), "step": name, "status": "ok", "elapsed_s": round(dt, 3)})
     return payload, dt
 
 
-async def run_one(cfg: RunOneConfig) -> None:
-    server_params = StdioServerParameters(
-        command="python",
-        args=["-m", "src.mcp_server.server"],
-        env=dict(os.environ),
+async def _run_job(
+    session: ClientSession,
+    cfg: RunOneConfig,
+    trace: list[dict[str, Any]],
+    metrics: RunOneMetrics,
+    t0: float,
+) -> None:
+    job_dir = cfg.out_dir / cfg.job_id
+    job_dir.mkdir(parents=True, exist_ok=True)
+    _write_json(job_dir / "run_one_config.json", asdict(cfg) | {"out_dir": str(cfg.out_dir)})
+
+    # 1) fetch_jd
+    fetch_payload, dt = await _call_tool(
+        session,
+        trace,
+        "fetch_jd",
+        {"job_id": cfg.job_id, "source": cfg.source},
+        cache=cfg.tool_cache,
     )
+    metrics.record_ms("fetch_jd", dt)
+    jd_text = fetch_payload.get("jd_text", "")
+    _write_text(job_dir / "jd.txt", jd_text)
+    _write_json(job_dir / "fetch.json", fetch_payload)
+
+    # Helper to run QC
+    async def qc(
+        structured: Any, parse_ok: bool, parse_repaired: bool, extractor: dict
+    ) -> Tuple[dict, float]:
+        qc_args = {
+            "job_id": cfg.job_id,
+            "structured": structured,
+            "parse_ok": parse_ok,
+            "parse_repaired": parse_repaired,
+            "extractor": extractor,
+            "require_keys": list(cfg.require_keys),
+            "require_non_empty_any_of": [list(x) for x in cfg.require_non_empty_any_of],
+        }
+        return await _call_tool(session, trace, "qc_validate", qc_args)
+
+    # 2) try local extraction (optional)
+    local_ok = False
+    local_payload = None
+    qc_local = None
+
+    if cfg.local_first:
+        metrics.local["attempted"] = True
+        try:
+            local_payload, dt = await _call_tool(
+                session,
+                trace,
+                "extract_local",
+                {
+                    "job_id": cfg.job_id,
+                    "jd_text": jd_text,
+                    "prompt_name": cfg.prompt_name,
+                    "temperature": cfg.temperature_extract,
+                    "max_tokens": cfg.max_tokens_extract,
+                },
+                cache=cfg.tool_cache,
+            )
+            metrics.record_ms("extract_local", dt)
+
+            # normalize expected keys similar to extract_api tool
+            structured = local_payload.get("structured")
+            parse_ok = bool(local_payload.get("parse_ok", False))
+            parse_repaired = bool(local_payload.get("parse_repaired", False))
+            extractor = local_payload.get("extractor", {"mode": "local"})
+
+            metrics.local["parse_ok"] = parse_ok
+            _write_json(job_dir / "structured_local.json", structured)
+            _write_json(
+                job_dir / "extract_local_meta.json",
+                {k: local_payload.get(k) for k in EXTRACT_META_KEYS},
+            )
+            _write_text(job_dir / "extract_local_raw.txt", local_payload.get("raw_output", ""))
+
+            qc_local, dt = await qc(structured, parse_ok, parse_repaired, extractor)
+            metrics.record_ms("qc_local", dt)
+            metrics.local["qc"] = qc_local.get("status")
 
+            _write_json(job_dir / "qc_local.json", qc_local)
+
+            local_ok = (qc_local.get("status") == "pass") and structured is not None
+        except Exception as e:
+            trace.append(
+                {
+                    "t": _ts(),
+                    "step": "extract_local",
+                    "status": "fail",
+                    "error": str(e)[:400],
+                }
+            )
+            metrics.local["parse_ok"] = False
+            metrics.local["qc"] = "error"
+            metrics.fallback_reason = metrics.fallback_reason or "local_error"
+
+    # 3) if local ok -> report; else fallback to api if enabled
+    chosen_structured = None
+    # chosen_extractor = None
+    chosen_qc = None
+
+    if local_ok:
+        metrics.route = "local_only"
+        chosen_structured = local_payload.get("structured")
+        # chosen_extractor = local_payload.get("extractor", {"mode": "local"})
+        chosen_qc = qc_local
+    else:
+        if cfg.local_first and cfg.fallback_to_api:
+            metrics.route = "local_then_api"
+            if metrics.fallback_reason is None:
+                # qc fail or parse fail are the common causes
+                if qc_local and qc_local.get("status") != "pass":
+                    metrics.fallback_reason = "qc_fail_local"
+                else:
+                    metrics.fallback_reason = "local_not_usable"
+        else:
+            metrics.route = "api_only"
+
+        if not cfg.fallback_to_api:
+            metrics.final_qc = qc_local.get("status") if qc_local else "fail"
+            _write_json(job_dir / "trace.json", trace)
+            _write_json(job_dir / "run_one_summary.json", metrics.summary(time.time() - t0))
+            return
+
+        # ---- extract_api
+        metrics.api["attempted"] = True
+        extract_args: Dict[str, Any] = {
+            "job_id": cfg.job_id,
+            "jd_text": jd_text,
+            "prompt_name": cfg.prompt_name,
+            "provider": cfg.provider,
+            "temperature": cfg.temperature_extract,
+            "max_tokens": cfg.max_tokens_extract,
+            # resolved here so the tool cache key changes with the provider default
+            "model": _api_model(cfg),
+        }
+
+        api_payload, dt = await _call_tool(
+            session, trace, "extract_api", extract_args, cache=cfg.tool_cache
+        )
+        metrics.record_ms("extract_api", dt)
+
+        structured = api_payload.get("structured")
+        parse_ok = bool(api_payload.get("parse_ok", False))
+        parse_repaired = bool(api_payload.get("parse_repaired", False))
+        extractor = api_payload.get("extractor", {"mode": "api", "provider": cfg.provider})
+
+        metrics.api["parse_ok"] = parse_ok
+        _write_json(job_dir / "structured_api.json", structured)
+        _write_json(
+            job_dir / "extract_api_meta.json",
+            {k: api_payload.get(k) for k in EXTRACT_META_KEYS},
+        )
+        _write_text(job_dir / "extract_api_raw.txt", api_payload.get("raw_output", ""))
+
+        qc_api, dt = await qc(structured, parse_ok, parse_repaired, extractor)
+        metrics.record_ms("qc_api", dt)
+        metrics.api["qc"] = qc_api.get("status")
+        _write_json(job_dir / "qc_api.json", qc_api)
+
+        chosen_structured = structured
+        # chosen_extractor = extractor
+        chosen_qc = qc_api
+
+    # 4) generate_report_api (only if QC pass)
+    if chosen_qc and chosen_qc.get("status") == "pass" and chosen_structured:
+        rep_args: Dict[str, Any] = {
+            "job_id": cfg.job_id,
+            "structured": chosen_structured,
+            "qc": chosen_qc,
+            "match": None,
+            "resume_text": None,
+            "provider": cfg.provider,
+            "temperature": cfg.temperature_report,
+            "max_tokens": cfg.max_tokens_report,
+            "model": _api_model(cfg),
+        }
+
+        rep_payload, dt = await _call_tool(
+            session, trace, "generate_report_api", rep_args, cache=cfg.tool_cache
+        )
+        metrics.record_ms("generate_report_api", dt)
+
+        _write_text(job_dir / "report.md", rep_payload.get("report_md", ""))
+        _write_json(
+            job_dir / "report_meta.json", {k: rep_payload.get(k) for k in ["usage", "meta"]}
+        )
+    else:
+        trace.append(
+            {
+                "t": _ts(),
+                "step": "generate_report_api",
+                "status": "skipped",
+                "reason": "qc_fail_or_no_structured",
+            }
+        )
+
+    metrics.final_qc = chosen_qc.get("status") if chosen_qc else "fail"
+    elapsed = time.time() - t0
+    trace.append({"t": _ts(), "step": "done", "status": "ok", "elapsed_s": round(elapsed, 2)})
+
+    _write_json(job_dir / "trace.json", trace)
+    _write_json(job_dir / "run_one_summary.json", metrics.summary(elapsed))
+
+
+async def run_one(cfg: RunOneConfig) -> None:
     trace: list[dict[str, Any]] = []
     metrics = RunOneMetrics()
     t0 = time.time()
 
-    job_dir = cfg.out_dir / cfg.job_id
-    job_dir.mkdir(parents=True, exist_ok=True)
-    _write_json(job_dir / "run_one_config.json", asdict(cfg) | {"out_dir": str(cfg.out_dir)})
-
-    async with stdio_client(server_params) as (read, write):
+    async with stdio_client(_server_params()) as (read, write):
         async with ClientSession(read, write) as session:
             trace.append({"t": _ts(), "step": "mcp.initialize", "status": "start"})
             await session.initialize()
             trace.append({"t": _ts(), "step": "mcp.initialize", "status": "ok"})
 
-            # 1) fetch_jd
-            fetch_payload, dt = await _call_tool(
-                session, trace, "fetch_jd", {"job_id": cfg.job_id, "source": cfg.source}
-            )
-            metrics.record_ms("fetch_jd", dt)
-            jd_text = fetch_payload.get("jd_text", "")
-            _write_text(job_dir / "jd.txt", jd_text)
-            _write_json(job_dir / "fetch.json", fetch_payload)
-
-            # Helper to run QC
-            async def qc(
-                structured: Any, parse_ok: bool, parse_repaired: bool, extractor: dict
-            ) -> Tuple[dict, float]:
-                qc_args = {
-                    "job_id": cfg.job_id,
-                    "structured": structured,
-                    "parse_ok": parse_ok,
-                    "parse_repaired": parse_repaired,
-                    "extractor": extractor,
-                    "require_keys": list(cfg.require_keys),
-                    "require_non_empty_any_of": [list(x) for x in cfg.require_non_empty_any_of],
-                }
-                return await _call_tool(session, trace, "qc_validate", qc_args)
-
-            # 2) try local extraction (optional)
-            local_ok = False
-            local_payload = None
-            qc_local = None
-
-            if cfg.local_first:
-                metrics.local["attempted"] = True
-                try:
-                    local_payload, dt = await _call_tool(
-                        session,
-                        trace,
-                        "extract_local",
-                        {
-                            "job_id": cfg.job_id,
-                            "jd_text": jd_text,
-                            "prompt_name": cfg.prompt_name,
-                            "temperature": cfg.temperature_extract,
-                            "max_tokens": cfg.max_tokens_extract,
-                        },
-                    )
-                    metrics.record_ms("extract_local", dt)
-
-                    # normalize expected keys similar to extract_api tool
-                    structured = local_payload.get("structured")
-                    parse_ok = bool(local_payload.get("parse_ok", False))
-                    parse_repaired = bool(local_payload.get("parse_repaired", False))
-                    extractor = local_payload.get("extractor", {"mode": "local"})
-
-                    metrics.local["parse_ok"] = parse_ok
-                    _write_json(job_dir / "structured_local.json", structured)
-                    _write_json(
-                        job_dir / "extract_local_meta.json",
-                        {
-                            k: local_payload.get(k)
-                            for k in ["parse_ok", "parse_repaired", "usage", "extractor"]
-                        },
-                    )
-                    _write_text(
-                        job_dir / "extract_local_raw.txt", local_payload.get("raw_output", "")
-                    )
-
-                    qc_local, dt = await qc(structured, parse_ok, parse_repaired, extractor)
-                    metrics.record_ms("qc_local", dt)
-                    metrics.local["qc"] = qc_local.get("status")
-
-                    _write_json(job_dir / "qc_local.json", qc_local)
-
-                    local_ok = (qc_local.get("status") == "pass") and structured is not None
-                except Exception as e:
-                    trace.append(
-                        {
-                            "t": _ts(),
-                            "step": "extract_local",
-                            "status": "fail",
-                            "error": str(e)[:400],
-                        }
-                    )
-                    metrics.local["parse_ok"] = False
-                    metrics.local["qc"] = "error"
-                    metrics.fallback_reason = metrics.fallback_reason or "local_error"
-
-            # 3) if local ok -> report; else fallback to api if enabled
-            chosen_structured = None
-            # chosen_extractor = None
-            chosen_qc = None
-
-            if local_ok:
-                metrics.route = "local_only"
-                chosen_structured = local_payload.get("structured")
-                # chosen_extractor = local_payload.get("extractor", {"mode": "local"})
-                chosen_qc = qc_local
-            else:
-                if cfg.local_first and cfg.fallback_to_api:
-                    metrics.route = "local_then_api"
-                    if metrics.fallback_reason is None:
-                        # qc fail or parse fail are the common causes
-                        if qc_local and qc_local.get("status") != "pass":
-                            metrics.fallback_reason = "qc_fail_local"
-                        else:
-                            metrics.fallback_reason = "local_not_usable"
-                else:
-                    metrics.route = "api_only"
+            try:
+                await _run_job(session, cfg, trace, metrics, t0)
+            finally:
+                await aclose_clients()
 
-                if not cfg.fallback_to_api:
-                    metrics.final_qc = qc_local.get("status") if qc_local else "fail"
-                    _write_json(job_dir / "trace.json", trace)
-                    _write_json(job_dir / "run_one_summary.json", metrics.summary(time.time() - t0))
-                    return
 
-                # ---- extract_api
-                metrics.api["attempted"] = True
-                extract_args: Dict[str, Any] = {
-                    "job_id": cfg.job_id,
-                    "jd_text": jd_text,
-                    "prompt_name": cfg.prompt_name,
-                    "provider": cfg.provider,
-                    "temperature": cfg.temperature_extract,
-                    "max_tokens": cfg.max_tokens_extract,
-                }
-                if cfg.model:
-                    extract_args["model"] = cfg.model
-
-                api_payload, dt = await _call_tool(session, trace, "extract_api", extract_args)
-                metrics.record_ms("extract_api", dt)
-
-                structured = api_payload.get("structured")
-                parse_ok = bool(api_payload.get("parse_ok", False))
-                parse_repaired = bool(api_payload.get("parse_repaired", False))
-                extractor = api_payload.get("extractor", {"mode": "api", "provider": cfg.provider})
-
-                metrics.api["parse_ok"] = parse_ok
-                _write_json(job_dir / "structured_api.json", structured)
-                _write_json(
-                    job_dir / "extract_api_meta.json",
-                    {
-                        k: api_payload.get(k)
-                        for k in ["parse_ok", "parse_repaired", "usage", "extractor"]
-                    },
-                )
-                _write_text(job_dir / "extract_api_raw.txt", api_payload.get("raw_output", ""))
-
-                qc_api, dt = await qc(structured, parse_ok, parse_repaired, extractor)
-                metrics.record_ms("qc_api", dt)
-                metrics.api["qc"] = qc_api.get("status")
-                _write_json(job_dir / "qc_api.json", qc_api)
-
-                chosen_structured = structured
-                # chosen_extractor = extractor
-                chosen_qc = qc_api
-
-            # 4) generate_report_api (only if QC pass)
-            if chosen_qc and chosen_qc.get("status") == "pass" and chosen_structured:
-                rep_args: Dict[str, Any] = {
-                    "job_id": cfg.job_id,
-                    "structured": chosen_structured,
-                    "qc": chosen_qc,
-                    "match": None,
-                    "resume_text": None,
-                    "provider": cfg.provider,
-                    "temperature": cfg.temperature_report,
-                    "max_tokens": cfg.max_tokens_report,
-                }
-                if cfg.model:
-                    rep_args["model"] = cfg.model
-
-                rep_payload, dt = await _call_tool(session, trace, "generate_report_api", rep_args)
-                metrics.record_ms("generate_report_api", dt)
-
-                _write_text(job_dir / "report.md", rep_payload.get("report_md", ""))
-                _write_json(
-                    job_dir / "report_meta.json", {k: rep_payload.get(k) for k in ["usage", "meta"]}
-                )
-            else:
-                trace.append(
-                    {
-                        "t": _ts(),
-                        "step": "generate_report_api",
-                        "status": "skipped",
-                        "reason": "qc_fail_or_no_structured",
-                    }
-                )
-
-            metrics.final_qc = chosen_qc.get("status") if chosen_qc else "fail"
-            elapsed = time.time() - t0
-            trace.append(
-                {"t": _ts(), "step": "done", "status": "ok", "elapsed_s": round(elapsed, 2)}
-            )
+async def run_batch(cfgs: list[RunOneConfig], concurrency: int = 8) -> None:
+    """
+    Run several jobs through one MCP server process and session, at most
+    `concurrency` at a time. A failing job is reported on stderr and does not stop
+    the others; the process exits 1 if any job failed.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
 
-            _write_json(job_dir / "trace.json", trace)
-            _write_json(job_dir / "run_one_summary.json", metrics.summary(elapsed))
+    async with stdio_client(_server_params()) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+
+            async def one(cfg: RunOneConfig) -> None:
+                async with sem:
+                    await _run_job(session, cfg, [], RunOneMetrics(), time.time())
+
+            results = await asyncio.gather(*(one(c) for c in cfgs), return_exceptions=True)
+            await aclose_clients()
+
+    failed = 0
+    for cfg, res in zip(cfgs, results):
+        if isinstance(res, BaseException):
+            failed += 1
+            print(f"[fail] job_id={cfg.job_id}: {res}", file=sys.stderr)
+    if failed:
+        print(f"[fail] {failed}/{len(cfgs)} jobs failed", file=sys.stderr)
+        raise SystemExit(1)
 
 
 def main() -> None:
     ap = argparse.ArgumentParser()
-    ap.add_argument("--job-id", required=True)
+    ap.add_argument("--job-id", required=True, nargs="+")
     ap.add_argument("--provider", default="openai", choices=["openai", "nvidia"])
     ap.add_argument("--model", default=None)
     ap.add_argument("--prompt-name", default="jd_extract_v2")
@@ -365,20 +507,34 @@ def main() -> None:
     ap.add_argument("--no-local-first", dest="local_first", action="store_false")
     ap.add_argument("--fallback-to-api", action="store_true", default=True)
     ap.add_argument("--no-fallback-to-api", dest="fallback_to_api", action="store_false")
+    ap.add_argument(
+        "--tool-cache",
+        action="store_true",
+        help=f"reuse fetch/extract/report tool results cached under {TOOL_CACHE_DIR}",
+    )
+    ap.add_argument("--concurrency", type=int, default=8, help="jobs in flight when batching")
 
     args = ap.parse_args()
 
-    cfg = RunOneConfig(
-        job_id=args.job_id,
-        provider=args.provider,
-        model=args.model,
-        prompt_name=args.prompt_name,
-        out_dir=Path(args.out_dir),
-        local_first=args.local_first,
-        fallback_to_api=args.fallback_to_api,
-    )
-
-    asyncio.run(run_one(cfg))
+    cfgs = [
+        RunOneConfig(
+            job_id=job_id,
+            provider=args.provider,
+            model=args.model,
+            prompt_name=args.prompt_name,
+            out_dir=Path(args.out_dir),
+            local_first=args.local_first,
+            fallback_to_api=args.fallback_to_api,
+            tool_cache=args.tool_cache,
+        )
+        for job_id in args.job_id
+    ]
+
+    install_uvloop()
+    if len(cfgs) == 1:
+        asyncio.run(run_one(cfgs[0]))
+    else:
+        asyncio.run(run_batch(cfgs, concurrency=args.concurrency))
 
 
 if __name__ == "__main__":
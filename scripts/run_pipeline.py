@@ -21,8 +21,9 @@ from playwright_stealth import Stealth
 from src import db
 from src.config import ScrapeConfig
 from src.extract import extract_skills
+from src.scrape.blocking import block_heavy_resources
 from src.scrape.detail import parse_job_detail, to_dict
-from src.scrape.list import collect_job_links
+from src.scrape.list import collect_job_links_many
 
 # ----------------------------
 # Utils
@@ -268,6 +269,7 @@ async def main() -> None:
             "per_page": cfg.per_page,
             "limit": cfg.limit,
             "headless": cfg.headless,
+            "block_resources": cfg.block_resources,
         },
     )
 
@@ -277,16 +279,24 @@ async def main() -> None:
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=cfg.headless)
         context = await browser.new_context(storage_state=auth_file)
-        page = await context.new_page()
+        if cfg.block_resources:
+            await block_heavy_resources(context)
         stealth = Stealth()
         await stealth.apply_stealth_async(context)
-        page.set_default_timeout(cfg.selector_timeout_ms)
-        page.set_default_navigation_timeout(cfg.goto_timeout_ms)
+
+        # context-level defaults apply to every page, including the list-page pool
+        context.set_default_timeout(cfg.selector_timeout_ms)
+        context.set_default_navigation_timeout(cfg.goto_timeout_ms)
+        page = await context.new_page()
 
         # ---- collect links
         t0 = time.monotonic()
-        job_links = await collect_job_links(
-            page, pages=cfg.pages, per_page=cfg.per_page, timeout_ms=cfg.networkidle_timeout_ms
+        job_links = await collect_job_links_many(
+            context,
+            pages=cfg.pages,
+            per_page=cfg.per_page,
+            timeout_ms=cfg.networkidle_timeout_ms,
+            concurrency=cfg.list_concurrency,
         )
         dt = time.monotonic() - t0
         metrics.record_stage("collect_links", dt)
@@ -319,6 +329,11 @@ async def main() -> None:
 
             await polite_sleep(cfg)
 
+            if cfg.page_recycle_every > 0 and i > 1 and (i - 1) % cfg.page_recycle_every == 0:
+                # same context (cookies, HTTP cache), fresh renderer state
+                await page.close()
+                page = await context.new_page()
+
             # parse with retries
             jd_obj = None
             last_exc: Optional[Exception] = None
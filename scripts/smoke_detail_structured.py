@@ -1,44 +1,57 @@
+import argparse
+import asyncio
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 
-from src.scrape.detail import parse_job_detail, to_dict
+from src.scrape.blocking import block_heavy_resources
+from src.scrape.detail import parse_many, to_dict
 
 STATE_PATH = Path("data/auth_state.json")
 LINKS_FILE = Path("data/raw/job_links_page1.txt")
 
 
-def main():
-    url = LINKS_FILE.read_text(encoding="utf-8").splitlines()[0].strip()
+async def main(n: int, concurrency: int):
+    lines = LINKS_FILE.read_text(encoding="utf-8").splitlines()
+    urls = [x.strip() for x in lines if x.strip()][:n]
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=str(STATE_PATH))
-        page = context.new_page()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=False)
+        context = await browser.new_context(storage_state=str(STATE_PATH))
+        await block_heavy_resources(context)
 
-        jd = parse_job_detail(page, url)
-        d = to_dict(jd)
+        results = await parse_many(context, urls, concurrency=concurrency)
 
-        print("=== STRUCTURED ===")
-        for k in [
-            "title",
-            "company",
-            "posted_text",
-            "apply_by_text",
-            "pay_text",
-            "location_text",
-            "employment_type",
-            "date_range_text",
-            "work_auth_text",
-            "opt_cpt_text",
-        ]:
-            print(f"{k}: {d.get(k)}")
+        for url, jd in zip(urls, results):
+            if isinstance(jd, Exception):
+                print(f"\n=== FAILED {url}: {type(jd).__name__}: {jd}")
+                continue
+            d = to_dict(jd)
 
-        print("\n=== DESCRIPTION SNIPPET (first 800 chars) ===")
-        print((d.get("description") or "")[:800])
+            print(f"\n=== STRUCTURED ({url}) ===")
+            for k in [
+                "title",
+                "company",
+                "posted_text",
+                "apply_by_text",
+                "pay_text",
+                "location_text",
+                "employment_type",
+                "date_range_text",
+                "work_auth_text",
+                "opt_cpt_text",
+            ]:
+                print(f"{k}: {d.get(k)}")
 
-        browser.close()
+            print("\n=== DESCRIPTION SNIPPET (first 800 chars) ===")
+            print((d.get("description") or "")[:800])
+
+        await browser.close()
 
 
 if __name__ == "__main__":
-    main()
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=1, help="number of links to parse")
+    ap.add_argument("--concurrency", type=int, default=5)
+    args = ap.parse_args()
+    asyncio.run(main(args.n, args.concurrency))
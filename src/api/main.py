@@ -33,6 +33,7 @@ from src.db import (
     fetch_metrics_summary,
     fetch_recent_scrape_runs,
 )
+from src.llm.providers.openai_compat_client import aclose_clients
 from src.observability.artifact_writer import (
     JobMarketChatArtifactWriter,
     SkillGapArtifactWriter,
@@ -64,6 +65,7 @@ async def lifespan(app: FastAPI):
         _report_service = None
         _job_market_chat_service = None
     yield
+    await aclose_clients()
 
 
 INDEX_DIR = Path("data/vectors")
@@ -36,11 +36,16 @@ class ScrapeConfig:
 
     # Browser
     headless: bool = _env_bool("HEADLESS", False)
+    block_resources: bool = _env_bool("BLOCK_RESOURCES", True)
+    # replace the detail page every N jobs to cap renderer memory growth (0 = never)
+    page_recycle_every: int = _env_int("PAGE_RECYCLE_EVERY", 50)
 
     # Scope
     pages: int = _env_int("PAGES", 1)
     per_page: int = _env_int("PER_PAGE", 25)
     limit: int = _env_int("LIMIT", 100)
+    # search-result pages loaded in parallel while collecting links
+    list_concurrency: int = _env_int("LIST_CONCURRENCY", 3)
 
     # Playwright timeouts (ms)
     goto_timeout_ms: int = _env_int("GOTO_TIMEOUT_MS", 20000)
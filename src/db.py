@@ -101,7 +101,8 @@ def get_conn(db_path: Path = DB_PATH) -> sqlite3.Connection:
 
 
 def _table_info(conn: sqlite3.Connection, table: str) -> List[str]:
-    rows = conn.execute(f"PRAGMA table_info({table});").fetchall()
+    # table_xinfo (unlike table_info) also lists generated columns
+    rows = conn.execute(f"PRAGMA table_xinfo({table});").fetchall()
     # row[1] is name
     return [r[1] for r in rows]
 
@@ -122,6 +123,36 @@ def migrate(conn: sqlite3.Connection) -> None:
     _add_column_if_missing(conn, "jobs", "content_hash TEXT", "content_hash")
     _add_column_if_missing(conn, "jobs", "last_seen_at_utc TEXT", "last_seen_at_utc")
 
+    # jobs: report flags as indexed virtual columns, so report counts are index
+    # lookups instead of LIKE scans over every description
+    _add_column_if_missing(
+        conn,
+        "jobs",
+        """has_opt_cpt INTEGER GENERATED ALWAYS AS (
+            LOWER(COALESCE(opt_cpt_text,'')) LIKE '%opt%'
+            OR LOWER(COALESCE(description,'')) LIKE '%cpt%'
+        ) VIRTUAL""",
+        "has_opt_cpt",
+    )
+    _add_column_if_missing(
+        conn,
+        "jobs",
+        """has_remote INTEGER GENERATED ALWAYS AS (
+            LOWER(COALESCE(location_text,'')) LIKE '%remote%'
+            OR LOWER(COALESCE(description,'')) LIKE '%work from home%'
+        ) VIRTUAL""",
+        "has_remote",
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_has_opt_cpt ON jobs(has_opt_cpt);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_has_remote ON jobs(has_remote);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at_utc);")
+
+    # report top-k: GROUP BY walks these indexes instead of building a temp B-tree
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill);")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(COALESCE(location_text,'(unknown)'));"
+    )
+
 
 def init_db() -> None:
     with get_conn() as conn:
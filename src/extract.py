@@ -5,10 +5,9 @@ import re
 from pathlib import Path
 from typing import Dict, List, Set
 
+from src.llm.prompt_templates import build_prompt
 from src.llm.providers.hf_local import HFLocalExtractor
 
-PROMPT_PATH = Path("src/llm/prompts/jd_extract_v1.txt")
-
 SKILL_MAP: Dict[str, List[str]] = {
     "python": ["python"],
     "sql": [
@@ -55,8 +54,7 @@ def extract_skills(text: str) -> Set[str]:
 
 
 def extract_job_baseline(job_id: str, jd_text: str) -> dict:
-    prompt_template = PROMPT_PATH.read_text()
-    prompt = prompt_template.replace("{{JOB_DESCRIPTION}}", jd_text)
+    prompt = build_prompt("jd_extract_v1", jd_text)
 
     extractor = HFLocalExtractor(model_name="Qwen/Qwen2.5-3B-Instruct", device="cuda")
 
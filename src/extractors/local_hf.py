@@ -165,8 +165,8 @@ Description:
             json_text = _strip_to_json(completion)
             data = json.loads(json_text)
 
-            # Validate with Pydantic
-            obj = JobStructured.model_validate(data)
+            # Validate with Pydantic (skipped when the output already conforms)
+            obj = JobStructured.fast_from_llm(data)
 
             # Normalize skills
             data2 = obj.model_dump()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+
 
 def strip_code_fences(text: str) -> str:
     t = (text or "").strip()
@@ -30,16 +31,18 @@ def extract_jsonish_tail(text: str) -> str:
     return t[start:].strip()
 
 
-def truncate_to_last_balanced(text: str) -> Optional[str]:
+def truncate_to_last_balanced(text: str) -> Tuple[Optional[str], List[str]]:
     """
     If output contains JSON followed by extra text, truncate at the last point
     where brackets are balanced (outside strings).
+
+    Returns (truncated_text_or_none, open_brackets_at_end) so callers can
+    close an unbalanced tail without scanning the text again.
     """
     t = text or ""
     stack: List[str] = []
     in_str = False
     esc = False
-    started = False
     last_balanced_end: Optional[int] = None
 
     for i, ch in enumerate(t):
@@ -58,19 +61,17 @@ def truncate_to_last_balanced(text: str) -> Optional[str]:
 
         if ch in "{[":
             stack.append(ch)
-            started = True
         elif ch in "}]":
             if stack:
                 top = stack[-1]
                 if (top == "{" and ch == "}") or (top == "[" and ch == "]"):
                     stack.pop()
-
-        if started and not in_str and not stack:
-            last_balanced_end = i + 1
+                    if not stack:
+                        last_balanced_end = i + 1
 
     if last_balanced_end is not None:
-        return t[:last_balanced_end].strip()
-    return None
+        return t[:last_balanced_end].strip(), stack
+    return None, stack
 
 
 def repair_brackets(text: str, max_append: int = 256) -> str:
@@ -81,39 +82,18 @@ def repair_brackets(text: str, max_append: int = 256) -> str:
     3) truncate to last balanced (fixes "Extra data")
     4) otherwise append missing closers (fixes missing } / ])
     """
-    t = strip_code_fences(text)
-    t = extract_jsonish_tail(t)
-
-    truncated = truncate_to_last_balanced(t)
+    t = text or ""
+    # Fences/prose only need stripping when the output doesn't already start with JSON
+    head = next((ch for ch in t if not ch.isspace()), "")
+    if head not in ("{", "["):
+        t = strip_code_fences(t)
+        if t[:1] not in ("{", "["):
+            t = extract_jsonish_tail(t)
+
+    truncated, stack = truncate_to_last_balanced(t)
     if truncated:
         return truncated
 
-    stack: List[str] = []
-    in_str = False
-    esc = False
-
-    for ch in t:
-        if in_str:
-            if esc:
-                esc = False
-            elif ch == "\\":
-                esc = True
-            elif ch == '"':
-                in_str = False
-            continue
-
-        if ch == '"':
-            in_str = True
-            continue
-
-        if ch in "{[":
-            stack.append(ch)
-        elif ch in "}]":
-            if stack:
-                top = stack[-1]
-                if (top == "{" and ch == "}") or (top == "[" and ch == "]"):
-                    stack.pop()
-
     closes = []
     for opener in reversed(stack):
         closes.append("}" if opener == "{" else "]")
@@ -133,7 +113,7 @@ def parse_json_object(text: str) -> Tuple[Optional[Dict[str, Any]], bool, str]:
 
     # First try as-is
     try:
-        obj = json.loads(raw)
+        obj = orjson.loads(raw)
         return (obj if isinstance(obj, dict) else None, False, raw)
     except Exception:
         pass
@@ -141,7 +121,7 @@ def parse_json_object(text: str) -> Tuple[Optional[Dict[str, Any]], bool, str]:
     # Repair/truncate
     repaired = repair_brackets(raw)
     try:
-        obj = json.loads(repaired)
+        obj = orjson.loads(repaired)
         return (obj if isinstance(obj, dict) else None, True, repaired)
     except Exception:
         return (None, True, repaired)
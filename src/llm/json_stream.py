@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import orjson
+from pydantic_core import from_json
+
+
+class JsonStreamTracker:
+    """
+    Incrementally track bracket depth (outside strings) of streamed model output.
+    Each character is visited once, so completion can be checked after every chunk
+    without re-scanning the accumulated text.
+    """
+
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+        self.size = 0
+        self.stack: List[str] = []
+        self.in_str = False
+        self.esc = False
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.end is not None
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Append a chunk. Returns True once the first top-level JSON value has closed.
+        """
+        offset = self.size
+        self.parts.append(chunk)
+        self.size += len(chunk)
+        if self.complete:
+            return True
+
+        for i, ch in enumerate(chunk):
+            if self.in_str:
+                if self.esc:
+                    self.esc = False
+                elif ch == "\\":
+                    self.esc = True
+                elif ch == '"':
+                    self.in_str = False
+                continue
+
+            if ch == '"':
+                # quotes in leading prose are not JSON strings
+                if self.start is not None:
+                    self.in_str = True
+                continue
+
+            if ch in "{[":
+                if self.start is None:
+                    self.start = offset + i
+                self.stack.append(ch)
+            elif ch in "}]" and self.stack:
+                top = self.stack[-1]
+                if (top == "{" and ch == "}") or (top == "[" and ch == "]"):
+                    self.stack.pop()
+                    if not self.stack:
+                        self.end = offset + i + 1
+                        break
+
+        return self.complete
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    def value_text(self) -> Optional[str]:
+        """
+        The completed top-level JSON value, without any surrounding prose.
+        """
+        if self.start is None or self.end is None:
+            return None
+        return self.text[self.start : self.end]
+
+
+def parse_partial_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a possibly truncated JSON object, keeping incomplete trailing strings.
+    Returns None if no JSON object can be recovered.
+    """
+    t = text or ""
+    start = t.find("{")
+    if start == -1:
+        return None
+    try:
+        obj = from_json(t[start:].strip(), allow_partial="trailing-strings")
+    except ValueError:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+@dataclass
+class JsonStreamResult:
+    text: str  # everything received, including any prose around the JSON
+    parsed: Optional[Dict[str, Any]]
+    complete: bool  # True if the top-level object closed before the stream ended
+    usage: Dict[str, Any] = field(default_factory=dict)
+
+
+def _delta_text(chunk: Dict[str, Any]) -> str:
+    try:
+        choice0 = (chunk.get("choices") or [])[0] or {}
+    except Exception:
+        return ""
+    content = (choice0.get("delta") or {}).get("content")
+    return content if isinstance(content, str) else ""
+
+
+async def collect_json_stream(
+    chunks: AsyncIterator[Dict[str, Any]], wait_for_usage: bool = False
+) -> JsonStreamResult:
+    """
+    Consume streamed chat-completion chunks until the JSON object closes.
+
+    Reading stops as soon as the top-level value is balanced, so trailing prose is
+    never waited for. With wait_for_usage (stream_options.include_usage was sent),
+    the rest of the stream is drained without being recorded until the final usage
+    chunk arrives. If the stream ends first (e.g. max_tokens hit), the partial
+    object is parsed with trailing strings kept.
+    """
+    tracker = JsonStreamTracker()
+    usage: Dict[str, Any] = {}
+    closed = False
+
+    async with aclosing(chunks) as stream:
+        async for chunk in stream:
+            usage = chunk.get("usage") or usage
+            if closed:
+                if usage:
+                    break
+                continue
+            delta = _delta_text(chunk)
+            if delta and tracker.feed(delta):
+                closed = True
+                if not wait_for_usage or usage:
+                    break
+
+    value = tracker.value_text()
+    if value is not None:
+        try:
+            obj = orjson.loads(value)
+            if isinstance(obj, dict):
+                return JsonStreamResult(text=tracker.text, parsed=obj, complete=True, usage=usage)
+        except orjson.JSONDecodeError:
+            pass
+
+    return JsonStreamResult(
+        text=tracker.text,
+        parsed=parse_partial_json_object(tracker.text),
+        complete=False,
+        usage=usage,
+    )
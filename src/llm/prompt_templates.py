@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+PLACEHOLDER = "{{JOB_DESCRIPTION}}"
+
+# Rough average for English text with BPE tokenizers; avoids a tokenizer dependency
+CHARS_PER_TOKEN = 4
+
+PROMPT_DIR = Path(__file__).resolve().parent / "prompts"
+
+PROMPTS: Dict[str, Path] = {
+    "jd_extract_v1": PROMPT_DIR / "jd_extract_v1.txt",
+    "jd_extract_v2": PROMPT_DIR / "jd_extract_v2.txt",
+    "jd_extract_v3": PROMPT_DIR / "jd_extract_v3.txt",
+}
+
+
+def _split_template(prompt_name: str, path: Path) -> Tuple[str, str]:
+    template = path.read_text(encoding="utf-8", errors="ignore")
+    head, sep, tail = template.partition(PLACEHOLDER)
+    if not sep:
+        raise ValueError(f"Prompt template {prompt_name} missing {PLACEHOLDER}")
+    return head, tail
+
+
+# Templates are static files: read and validate them once at import,
+# pre-split around the placeholder so each call is a plain concatenation.
+_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    name: _split_template(name, path) for name, path in PROMPTS.items()
+}
+
+
+def build_prompt(prompt_name: str, jd_text: str) -> str:
+    head, tail = _TEMPLATES[prompt_name]
+    return head + jd_text + tail
+
+
+def trim_jd_text(jd_text: str, max_tokens: Optional[int], head_ratio: float = 0.7) -> str:
+    """
+    Keep a JD within an approximate token budget before it is sent to a model.
+    Long JDs keep their head and tail (responsibilities/requirements usually sit
+    there) and drop the middle.
+    """
+    if not max_tokens or max_tokens <= 0:
+        return jd_text
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(jd_text) <= max_chars:
+        return jd_text
+
+    head = int(max_chars * head_ratio)
+    tail = max_chars - head
+    return jd_text[:head] + "\n...\n" + jd_text[-tail:]
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Any, Dict
+import weakref
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List
 
 import httpx
+import orjson
 
 from .openai_compat_providers import PROVIDERS, ProviderName
 
@@ -19,20 +23,99 @@ class OpenAICompatClient:
         self.base_url = os.environ.get(f"{provider.upper()}_BASE_URL", cfg.base_url).rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        # AsyncClient is bound to the loop it first ran on; keep one per running loop
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
 
-    async def chat_completions(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        url = (
+    def _http(self) -> httpx.AsyncClient:
+        """
+        Pooled HTTP/2 client for the running loop: concurrent requests to the provider
+        multiplex over one connection. Transport retries are connect-level only and
+        kept at 1 so failures surface fast; retry policy stays with the callers.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                transport=httpx.AsyncHTTPTransport(http2=True, retries=1),
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Close the running loop's pooled client (its open connections). A later
+        request on this loop builds a fresh one.
+        """
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _chat_completions_url(self) -> str:
+        return (
             f"{self.base_url}/chat/completions"
             if self.base_url.endswith("/v1")
             else f"{self.base_url}/v1/chat/completions"
         )
+
+    async def chat_completions(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        url = self._chat_completions_url()
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        r = await self._http().post(url, headers=headers, json=payload)
+        try:
+            r.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            # include response body for debugging (OpenAI returns JSON error)
+            body = r.text
+            raise RuntimeError(f"HTTP {r.status_code} from {url}: {body}") from e
+        return r.json()
+
+    async def chat_completions_stream(
+        self, payload: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        POST with stream=True and yield each SSE `data:` chunk as a dict.
+        Closing the iterator early closes the HTTP response.
+        """
+        url = self._chat_completions_url()
         headers = {"Authorization": f"Bearer {self.api_key}"}
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            r = await client.post(url, headers=headers, json=payload)
-            try:
-                r.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                # include response body for debugging (OpenAI returns JSON error)
-                body = r.text
-                raise RuntimeError(f"HTTP {r.status_code} from {url}: {body}") from e
-            return r.json()
+        async with self._http().stream(
+            "POST", url, headers=headers, json={**payload, "stream": True}
+        ) as r:
+            if r.is_error:
+                body = (await r.aread()).decode("utf-8", errors="ignore")
+                raise RuntimeError(f"HTTP {r.status_code} from {url}: {body}")
+
+            async for line in r.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                if data:
+                    yield orjson.loads(data)
+
+
+_shared_clients: List[OpenAICompatClient] = []
+
+
+@lru_cache(maxsize=None)
+def get_client(provider: ProviderName) -> OpenAICompatClient:
+    """
+    Shared client per provider, built on first use (a missing API key for one
+    provider must not break the others at import time).
+    """
+    client = OpenAICompatClient(provider=provider)
+    _shared_clients.append(client)
+    return client
+
+
+async def aclose_clients() -> None:
+    """
+    Close the running loop's connections for every client handed out by get_client.
+    Await before the loop shuts down (end of a script's main, server lifespan exit).
+    """
+    for client in _shared_clients:
+        await client.aclose()
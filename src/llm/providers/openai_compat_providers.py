@@ -12,6 +12,7 @@ class ProviderConfig:
     base_url: str  # e.g. https://api.openai.com or https://integrate.api.nvidia.com/v1
     api_key_env: str  # env var name
     default_model: str
+    supports_json_mode: bool = False  # accepts response_format={"type": "json_object"}
 
 
 PROVIDERS: Dict[ProviderName, ProviderConfig] = {
@@ -20,6 +21,7 @@ PROVIDERS: Dict[ProviderName, ProviderConfig] = {
         base_url="https://api.openai.com",
         api_key_env="OPENAI_API_KEY",
         default_model="gpt-4o-mini",
+        supports_json_mode=True,
     ),
     "nvidia": ProviderConfig(
         name="nvidia",
@@ -1,14 +1,30 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from mcp.server.fastmcp import FastMCP
 
+from src.llm.providers.openai_compat_client import aclose_clients
+from src.runtime.loop import install_uvloop
+
 from .tools_extract import extract_local
 from .tools_extract_api import extract_api
 from .tools_fetch import fetch_jd
 from .tools_qc import qc_validate
 from .tools_report import generate_report_api
 
-mcp = FastMCP("jobpulse")
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        # API tools pool provider connections on the server loop; close them on shutdown
+        await aclose_clients()
+
+
+mcp = FastMCP("jobpulse", lifespan=_lifespan)
 
 # Register tools (decorators can be defined in respective files; explicit registration here for clarity)
 mcp.tool()(fetch_jd)
@@ -20,6 +36,7 @@ mcp.tool()(extract_api)
 
 def main():
     # stdio: the most common local process method (Cursor/Claude Desktop/Agent SDK are also commonly used)
+    install_uvloop()
     mcp.run(transport="stdio")
 
 
@@ -1,27 +1,12 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Any, Dict, Literal, Optional
 
+from src.llm.prompt_templates import build_prompt
 from src.llm.providers.hf_chat_lora import HFChatLoRAExtractor
 from src.llm.providers.hf_plain import HFPlainExtractor
 from src.orch.schema import ExtractLocalOutput, JobStructured
 
-PROMPTS = {
-    "jd_extract_v1": Path("src/llm/prompts/jd_extract_v1.txt"),
-    "jd_extract_v2": Path("src/llm/prompts/jd_extract_v2.txt"),
-    "jd_extract_v3": Path("src/llm/prompts/jd_extract_v3.txt"),
-}
-
-
-def _build_prompt(prompt_name: str, jd_text: str) -> str:
-    template = PROMPTS[prompt_name].read_text(encoding="utf-8", errors="ignore")
-    # Assert check: Ensure the template contains the placeholder and that it gets replaced
-    assert "{{JOB_DESCRIPTION}}" in template, "Prompt template missing {{JOB_DESCRIPTION}}"
-    prompt = template.replace("{{JOB_DESCRIPTION}}", jd_text)
-    assert "{{JOB_DESCRIPTION}}" not in prompt, "Placeholder not replaced"
-    return prompt
-
 
 def extract_local(
     job_id: str,
@@ -50,7 +35,7 @@ def extract_local(
     mode="plain": use HFPlainExtractor (baseline)
     mode="chat_lora": use HFChatLoRAExtractor (chat template; optional LoRA)
     """
-    prompt = _build_prompt(prompt_name, jd_text)
+    prompt = build_prompt(prompt_name, jd_text)
 
     do_sample = bool(temperature and temperature > 0)
 
@@ -1,20 +1,16 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
 from typing import Any, Dict, Literal, Optional
 
+import orjson
+
 from src.llm.json_repair import parse_json_object
-from src.llm.providers.openai_compat_client import OpenAICompatClient
+from src.llm.json_stream import collect_json_stream
+from src.llm.prompt_templates import build_prompt, trim_jd_text
+from src.llm.providers.openai_compat_client import get_client
 from src.llm.providers.openai_compat_providers import PROVIDERS
 from src.orch.schema import ExtractAPIOutput, JobStructured
 
-PROMPTS = {
-    "jd_extract_v1": Path("src/llm/prompts/jd_extract_v1.txt"),
-    "jd_extract_v2": Path("src/llm/prompts/jd_extract_v2.txt"),
-    "jd_extract_v3": Path("src/llm/prompts/jd_extract_v3.txt"),
-}
-
 
 def _get_message_text(resp: Dict[str, Any]) -> str:
     """
@@ -60,15 +56,6 @@ def _get_message_text(resp: Dict[str, Any]) -> str:
     return ""
 
 
-def _build_prompt(prompt_name: str, jd_text: str) -> str:
-    template = PROMPTS[prompt_name].read_text(encoding="utf-8", errors="ignore")
-    # Assert check: Ensure the template contains the placeholder and that it gets replaced
-    assert "{{JOB_DESCRIPTION}}" in template, "Prompt template missing {{JOB_DESCRIPTION}}"
-    prompt = template.replace("{{JOB_DESCRIPTION}}", jd_text)
-    assert "{{JOB_DESCRIPTION}}" not in prompt, "Placeholder not replaced"
-    return prompt
-
-
 async def extract_api(
     job_id: str,
     jd_text: str,
@@ -78,11 +65,19 @@ async def extract_api(
     temperature: float = 0.6,
     max_tokens: int = 900,
     thinking: Literal["auto", "disabled", "enabled"] = "disabled",
+    stream: bool = False,
+    max_jd_tokens: Optional[int] = 6000,
 ) -> ExtractAPIOutput:
     """
     Extraction using an OpenAI-compatible API provider.
     Providers supported: openai, nvidia.
 
+    stream=True reads the completion incrementally and stops as soon as the
+    JSON object closes; a truncated stream is parsed as partial JSON.
+
+    max_jd_tokens caps the JD (approximately, by characters) before it is
+    inlined into the prompt; None disables trimming.
+
     Env:
       OPENAI_API_KEY for provider=openai
       NVIDIA_API_KEY for provider=nvidia
@@ -94,7 +89,7 @@ async def extract_api(
     if model is None:
         model = cfg.default_model
 
-    prompt = _build_prompt(prompt_name, jd_text)
+    prompt = build_prompt(prompt_name, trim_jd_text(jd_text, max_jd_tokens))
 
     system = (
         "You are an information extraction system. "
@@ -127,17 +122,40 @@ async def extract_api(
             "extra_body", None
         )  # OpenAI doesn't support thinking control (ignore if present)
 
-    client = OpenAICompatClient(provider=provider)
-    resp = await client.chat_completions(payload)
-
-    content = _get_message_text(resp)
-    usage = resp.get("usage", {})
-
-    # If provider returned no content, keep the full response for debugging
-    if not content.strip():
-        content = json.dumps(resp, ensure_ascii=False)
+    # JSON mode: the provider guarantees a bare JSON object (no fences/prose);
+    # repair still covers outputs truncated by max_tokens.
+    if cfg.supports_json_mode:
+        payload["response_format"] = {"type": "json_object"}
+
+    client = get_client(provider)
+
+    if stream:
+        if provider == "openai":
+            payload["stream_options"] = {"include_usage": True}
+        streamed = await collect_json_stream(
+            client.chat_completions_stream(payload),
+            wait_for_usage="stream_options" in payload,
+        )
+        content = streamed.text
+        usage = streamed.usage
+        if streamed.complete:
+            parsed, repaired_flag, used_text = streamed.parsed, False, content
+        elif streamed.parsed is not None:
+            parsed, repaired_flag, used_text = streamed.parsed, True, content
+        else:
+            parsed, repaired_flag, used_text = parse_json_object(content)
+    else:
+        resp = await client.chat_completions(payload)
+
+        content = _get_message_text(resp)
+        usage = resp.get("usage", {})
+
+        # If provider returned no content, keep the full response for debugging
+        if not content.strip():
+            content = orjson.dumps(resp).decode("utf-8")
+
+        parsed, repaired_flag, used_text = parse_json_object(content)
 
-    parsed, repaired_flag, used_text = parse_json_object(content)
     parse_ok = parsed is not None
 
     structured: Optional[JobStructured] = None
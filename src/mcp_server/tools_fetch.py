@@ -21,9 +21,10 @@ def fetch_jd(job_id: str, source: Optional[str] = None) -> FetchJDOutput:
       {job_id, jd_text, jd_path, meta}
     """
     path = JD_DIR / f"{job_id}.txt"
-    jd_text = path.read_text(encoding="utf-8", errors="ignore")
-
-    md5 = hashlib.md5(jd_text.encode("utf-8", errors="ignore")).hexdigest()
+    # Read once: hash the raw bytes, then decode for the returned text
+    raw = path.read_bytes()
+    md5 = hashlib.md5(raw).hexdigest()
+    jd_text = raw.decode("utf-8", errors="ignore")
 
     return {
         "job_id": job_id,
@@ -32,6 +33,7 @@ def fetch_jd(job_id: str, source: Optional[str] = None) -> FetchJDOutput:
         "meta": {
             "source": source,
             "len": len(jd_text),
+            "bytes": len(raw),
             "md5": md5,
         },
     }
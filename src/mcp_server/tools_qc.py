@@ -42,17 +42,19 @@ def qc_validate(
             "extractor": extractor,
         }
 
+    # one pass over the payload; the checks below are set lookups
+    non_empty = {k for k, v in structured.items() if _is_non_empty(v)}
+
     # required keys present + non-empty
     for k in require_keys:
-        v = structured.get(k)  # type: ignore
-        ok = _is_non_empty(v)
+        ok = k in non_empty
         coverage[k] = 1.0 if ok else 0.0
         if not ok:
             missing_or_empty.append(k)
 
     # at least one group satisfies "any_of"
     for group in require_non_empty_any_of:
-        if not any(_is_non_empty(structured.get(k)) for k in group):  # type: ignore
+        if non_empty.isdisjoint(group):
             issues.append(f"low_coverage_any_of:{group}")
 
     if missing_or_empty:
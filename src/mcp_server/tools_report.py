@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, Literal, Optional
 
-from src.llm.providers.openai_compat_client import OpenAICompatClient
+import orjson
+
+from src.llm.providers.openai_compat_client import get_client
 from src.llm.providers.openai_compat_providers import PROVIDERS, ProviderName
 from src.orch.schema import JobStructured, MatchOutput, QCResult, ReportOutput
 
+_PRETTY_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _to_pretty_json(obj: Any) -> str:
+    return orjson.dumps(obj, option=_PRETTY_JSON_OPTS).decode("utf-8")
+
 
 def _build_report_prompt(
     structured: JobStructured,
@@ -24,9 +31,9 @@ def _build_report_prompt(
         "2) Key requirements (bullets)\n"
         "3) Skill gaps (bullets)\n"
         "4) 2-week action plan (bullets)\n\n"
-        f"STRUCTURED_JSON:\n{json.dumps(structured, ensure_ascii=False, indent=2)}\n\n"
-        f"QC:\n{json.dumps(qc, ensure_ascii=False, indent=2)}\n\n"
-        f"MATCH:\n{json.dumps(match, ensure_ascii=False, indent=2) if match else 'null'}\n\n"
+        f"STRUCTURED_JSON:\n{_to_pretty_json(structured)}\n\n"
+        f"QC:\n{_to_pretty_json(qc)}\n\n"
+        f"MATCH:\n{_to_pretty_json(match) if match else 'null'}\n\n"
         f"RESUME_TEXT:\n{resume_text or ''}\n"
     )
 
@@ -85,7 +92,7 @@ async def generate_report_api(
     if model is None:
         model = cfg.default_model
 
-    client = OpenAICompatClient(provider=prov)
+    client = get_client(prov)
 
     user_content = _build_report_prompt(structured, qc, match, resume_text)
     messages = [
@@ -121,7 +128,7 @@ async def generate_report_api(
     usage = resp.get("usage", {})
 
     if not content.strip():
-        content = json.dumps(resp, ensure_ascii=False)
+        content = orjson.dumps(resp).decode("utf-8")
 
     return {
         "job_id": job_id,
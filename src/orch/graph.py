@@ -1,16 +1,31 @@
+"""
+LangGraph is the primary runtime orchestrator for JobPulse.
+
+This graph calls core services directly and does not depend on MCP tool execution.
+"""
+
 from __future__ import annotations
 
+import asyncio
+import operator
+import sys
 import time
-from typing import Any, Dict, Literal, Optional, TypedDict
+from typing import Annotated, Any, Awaitable, Dict, Literal, Optional, TypedDict
 
 from langgraph.graph import END, StateGraph
 
-from src.services.extraction_service import ExtractionService
+from src.services.extraction_service import ExtractionService, ExtractResult
 from src.services.job_fetch_service import JobFetchService
 from src.services.qc_service import QCService
 from src.services.report_service import ReportService
 
-# Path("data/artifacts/_debug").mkdir(parents=True, exist_ok=True)
+__all__ = ["GraphState", "build_graph"]
+
+# Services are stateless; share one instance per process instead of one per node call
+_fetch_service = JobFetchService()
+_extraction_service = ExtractionService()
+_qc_service = QCService()
+_report_service = ReportService()
 
 
 def _input_value(state: GraphState, key: str, default: Any = None) -> Any:
@@ -58,7 +73,7 @@ class GraphState(TypedDict, total=False):
     report_md: Optional[str]
     report_meta: dict
 
-    trace: list[dict]
+    trace: Annotated[list[dict], operator.add]
     metrics: Dict[str, Any]
     decisions: list[dict]
     run_id: str
@@ -81,19 +96,51 @@ class GraphState(TypedDict, total=False):
     artifacts: Dict[str, Any]
     errors: list[dict]
 
+    # extract_api result requested ahead of time by node_extract_race
+    speculative_api: Optional[Dict[str, Any]]
+
     # optional runtime handles
     _mcp_session: Any
 
 
+# (epoch second, formatted) of the last _now() call; trace entries arrive in bursts
+# within the same second, so strftime runs at most once per second
+_now_cache: list = [-1, ""]
+
+
 def _now() -> str:
-    return time.strftime("%Y-%m-%d %H:%M:%S")
+    sec = int(time.time())
+    if sec != _now_cache[0]:
+        _now_cache[0] = sec
+        _now_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+    return _now_cache[1]
+
+
+def _trace(step: str, status: str, **meta: Any) -> Dict[str, Any]:
+    return {"t": _now(), "step": step, "status": status, **meta}
+
+
+def _with_node_ms(state: GraphState, node: str, ms: float) -> Dict[str, Any]:
+    metrics = dict(state.get("metrics") or {})
+    metrics["node_ms"] = {**(metrics.get("node_ms") or {}), node: ms}
+    return metrics
 
 
-def _trace(state: GraphState, step: str, status: str, **meta: Any) -> None:
-    state.setdefault("trace", [])
-    state.setdefault("metrics", {}).setdefault("node_ms", {})
-    entry = {"t": _now(), "step": step, "status": status, **meta}
-    state["trace"].append(entry)
+# top-level sections created by _ensure_v2_state
+_V2_KEYS = (
+    "run",
+    "input",
+    "config_routing",
+    "config_models",
+    "qc_policy",
+    "features",
+    "job",
+    "extraction",
+    "qc_state",
+    "report_state",
+    "artifacts",
+    "errors",
+)
 
 
 def _ensure_v2_state(state: dict[str, Any]) -> None:
@@ -208,64 +255,50 @@ def _append_qc_attempt(
     state["qc_state"]["selected_attempt"] = len(state["qc_state"]["attempts"]) - 1
 
 
-def _tool_result_text(res: Any) -> str:
-    parts = []
-    for b in getattr(res, "content", []) or []:
-        t = getattr(b, "text", None)
-        if isinstance(t, str):
-            parts.append(t)
-    return "".join(parts)
-
-
 # -----------------------
 # Nodes
+#
+# Nodes return only the keys they changed; LangGraph merges them into the state
+# and appends "trace" entries through its reducer.
 # -----------------------
 
 
-async def node_fetch_jd(state: GraphState) -> GraphState:
+async def node_fetch_jd(state: GraphState) -> Dict[str, Any]:
     started = time.perf_counter()
 
     _ensure_v2_state(state)
     job_id = _input_value(state, "job_id")
     source = _input_value(state, "source", "handshake")
 
-    svc = JobFetchService()
-    result = await svc.fetch(job_id=job_id, source=source)
+    result = await _fetch_service.fetch(job_id=job_id, source=source)
     payload = result.to_dict()
 
-    state["jd_text"] = payload["jd_text"]
     state["job"]["jd_text"] = payload["jd_text"]
     state["job"]["jd_path"] = payload.get("jd_path")
     state["job"]["jd_meta"] = payload.get("meta") or {}
 
-    trace = list(state.get("trace", []))
-    trace.append(
-        {
-            "node": "fetch_jd",
-            "ok": True,
-            "source": source,
-            "job_id": job_id,
-            "jd_len": len(payload["jd_text"]),
-            "meta": payload.get("meta") or {},
-        }
-    )
-    state["trace"] = trace
-
-    metrics = dict(state.get("metrics", {}))
-    node_ms = dict(metrics.get("node_ms", {}))
-    node_ms["fetch_jd"] = round((time.perf_counter() - started) * 1000, 2)
-    metrics["node_ms"] = node_ms
-    state["metrics"] = metrics
-
-    return state
-
-
-async def node_extract_local(state: GraphState) -> GraphState:
-    started = time.perf_counter()
+    return {
+        # first node: persist the v2 sections _ensure_v2_state filled in
+        **{k: state[k] for k in _V2_KEYS},
+        "jd_text": payload["jd_text"],
+        "trace": [
+            {
+                "node": "fetch_jd",
+                "ok": True,
+                "source": source,
+                "job_id": job_id,
+                "jd_len": len(payload["jd_text"]),
+                "meta": payload.get("meta") or {},
+            }
+        ],
+        "metrics": _with_node_ms(
+            state, "fetch_jd", round((time.perf_counter() - started) * 1000, 2)
+        ),
+    }
 
-    svc = ExtractionService()
 
-    result = await svc.extract_local(
+def _extract_local_call(state: GraphState) -> Awaitable[ExtractResult]:
+    return _extraction_service.extract_local(
         job_id=_input_value(state, "job_id"),
         jd_text=state["jd_text"],
         prompt_name=_model_value(state, "prompt_name", "jd_extract_v2"),
@@ -276,19 +309,56 @@ async def node_extract_local(state: GraphState) -> GraphState:
         max_tokens=state.get("max_tokens", 1024),
     )
 
-    payload = result.to_dict()
 
-    state["structured"] = payload["structured"]
-    state["raw_output"] = payload["raw_output"]
-    state["parse_ok"] = payload["parse_ok"]
-    state["parse_repaired"] = payload["parse_repaired"]
-    state["extract_meta"] = {
-        "parse_ok": payload["parse_ok"],
-        "parse_repaired": payload["parse_repaired"],
-        "usage": payload.get("usage") or {},
-        "extractor": payload.get("extractor") or {},
-    }
+def _extract_api_call(state: GraphState, provider: str) -> Awaitable[ExtractResult]:
+    return _extraction_service.extract_api(
+        job_id=_input_value(state, "job_id"),
+        jd_text=state["jd_text"],
+        prompt_name=_model_value(state, "prompt_name", "jd_extract_v2"),
+        provider=provider,
+        model=_model_value(state, "extract_model"),
+        temperature=0.0,
+        max_tokens=1200,
+    )
+
+
+async def node_extract_local(state: GraphState) -> Dict[str, Any]:
+    started = time.perf_counter()
+    result = await _extract_local_call(state)
+    return _record_local_extraction(state, result.to_dict(), "extract_local", started)
 
+
+async def node_extract_race(state: GraphState) -> Dict[str, Any]:
+    """
+    Speculative local extraction: the API extraction runs concurrently and its
+    result is kept for node_extract_api, so a local QC failure does not pay for
+    a second, sequential API round-trip.
+    """
+    started = time.perf_counter()
+    provider = state.get("extract_provider", "openai")
+    _ensure_v2_state(state)
+
+    local_res, api_res = await asyncio.gather(
+        _extract_local_call(state),
+        _extract_api_call(state, provider),
+        return_exceptions=True,
+    )
+
+    if isinstance(api_res, BaseException):
+        speculative = {"payload": None, "error": str(api_res)}
+    else:
+        speculative = {"payload": api_res.to_dict(), "error": None}
+
+    if isinstance(local_res, BaseException):
+        raise local_res
+    update = _record_local_extraction(state, local_res.to_dict(), "extract_race", started)
+    update["speculative_api"] = speculative
+    return update
+
+
+def _record_local_extraction(
+    state: GraphState, payload: Dict[str, Any], node: str, started: float
+) -> Dict[str, Any]:
     _append_extraction_attempt(
         state,
         stage="primary",
@@ -296,56 +366,48 @@ async def node_extract_local(state: GraphState) -> GraphState:
         payload=payload,
     )
 
-    trace = list(state.get("trace", []))
-    trace.append(
-        {
-            "node": "extract_local",
-            "ok": payload["parse_ok"],
+    return {
+        "structured": payload["structured"],
+        "raw_output": payload["raw_output"],
+        "parse_ok": payload["parse_ok"],
+        "parse_repaired": payload["parse_repaired"],
+        "extract_meta": {
+            "parse_ok": payload["parse_ok"],
             "parse_repaired": payload["parse_repaired"],
-            "extractor": payload["extractor"],
-        }
-    )
-    state["trace"] = trace
-
-    metrics = dict(state.get("metrics", {}))
-    node_ms = dict(metrics.get("node_ms", {}))
-    node_ms["extract_local"] = round((time.perf_counter() - started) * 1000, 2)
-    metrics["node_ms"] = node_ms
-    state["metrics"] = metrics
-
-    return state
+            "usage": payload.get("usage") or {},
+            "extractor": payload.get("extractor") or {},
+        },
+        "extraction": state["extraction"],
+        "trace": [
+            {
+                "node": node,
+                "ok": payload["parse_ok"],
+                "parse_repaired": payload["parse_repaired"],
+                "extractor": payload["extractor"],
+            }
+        ],
+        "metrics": _with_node_ms(state, node, round((time.perf_counter() - started) * 1000, 2)),
+    }
 
 
-async def node_extract_api(state: GraphState) -> GraphState:
+async def node_extract_api(state: GraphState) -> Dict[str, Any]:
     started = time.perf_counter()
     provider = state.get("extract_provider", "openai")
 
-    _trace(state, "extract_api", "start", provider=provider)
+    trace = [_trace("extract_api", "start", provider=provider)]
     _ensure_v2_state(state)
 
-    try:
-        svc = ExtractionService()
-        result = await svc.extract_api(
-            job_id=_input_value(state, "job_id"),
-            jd_text=state["jd_text"],
-            prompt_name=_model_value(state, "prompt_name", "jd_extract_v2"),
-            provider=provider,
-            model=_model_value(state, "extract_model"),
-            temperature=0.0,
-            max_tokens=1200,
-        )
-        payload = result.to_dict()
+    speculative = state.get("speculative_api")
 
-        state["structured"] = payload.get("structured")
-        state["raw_output"] = payload.get("raw_output")
-        state["parse_ok"] = payload.get("parse_ok")
-        state["parse_repaired"] = payload.get("parse_repaired")
-        state["extract_meta"] = {
-            "parse_ok": payload.get("parse_ok"),
-            "parse_repaired": payload.get("parse_repaired"),
-            "usage": payload.get("usage") or {},
-            "extractor": payload.get("extractor") or {},
-        }
+    try:
+        if speculative:
+            # already requested by node_extract_race
+            if speculative["error"]:
+                raise RuntimeError(speculative["error"])
+            payload = speculative["payload"]
+        else:
+            result = await _extract_api_call(state, provider)
+            payload = result.to_dict()
 
         stage = (
             "fallback"
@@ -361,86 +423,98 @@ async def node_extract_api(state: GraphState) -> GraphState:
         )
 
         dt = int((time.perf_counter() - started) * 1000)
-        state["metrics"]["node_ms"]["extract_api"] = dt
-        _trace(
-            state,
-            "extract_api",
-            "ok",
-            parse_ok=payload.get("parse_ok"),
-            parse_repaired=payload.get("parse_repaired"),
-            elapsed_ms=dt,
+        trace.append(
+            _trace(
+                "extract_api",
+                "ok",
+                parse_ok=payload.get("parse_ok"),
+                parse_repaired=payload.get("parse_repaired"),
+                speculative=bool(speculative),
+                elapsed_ms=dt,
+            )
         )
-        return state
+        return {
+            "structured": payload.get("structured"),
+            "raw_output": payload.get("raw_output"),
+            "parse_ok": payload.get("parse_ok"),
+            "parse_repaired": payload.get("parse_repaired"),
+            "extract_meta": {
+                "parse_ok": payload.get("parse_ok"),
+                "parse_repaired": payload.get("parse_repaired"),
+                "usage": payload.get("usage") or {},
+                "extractor": payload.get("extractor") or {},
+            },
+            "extraction": state["extraction"],
+            "speculative_api": None,
+            "trace": trace,
+            "metrics": _with_node_ms(state, "extract_api", dt),
+        }
 
     except Exception as e:
-        state["structured"] = None
-        state["raw_output"] = ""
-        state["parse_ok"] = False
-        state["parse_repaired"] = False
-        state["extract_meta"] = {
+        dt = int((time.perf_counter() - started) * 1000)
+        trace.append(_trace("extract_api", "fail", error=str(e), elapsed_ms=dt))
+        return {
+            "structured": None,
+            "raw_output": "",
             "parse_ok": False,
             "parse_repaired": False,
-            "extractor": {
-                "provider": provider,
-                "model": state.get("extract_model"),
+            "extract_meta": {
+                "parse_ok": False,
+                "parse_repaired": False,
+                "extractor": {
+                    "provider": provider,
+                    "model": state.get("extract_model"),
+                },
+                "error": str(e),
             },
-            "error": str(e),
+            "speculative_api": None,
+            "trace": trace,
+            "metrics": _with_node_ms(state, "extract_api", dt),
         }
 
-        dt = int((time.perf_counter() - started) * 1000)
-        state["metrics"]["node_ms"]["extract_api"] = dt
-        _trace(state, "extract_api", "fail", error=str(e), elapsed_ms=dt)
-        return state
-
 
-async def node_qc(state: GraphState) -> GraphState:
+async def node_qc(state: GraphState) -> Dict[str, Any]:
     started = time.perf_counter()
 
-    svc = QCService()
     _ensure_v2_state(state)
-    qc_result = await svc.validate(
+    # extraction nodes mirror parse flags into extract_meta; read it once
+    em = state.get("extract_meta") or {}
+    structured = state.get("structured")
+    qc_result = await _qc_service.validate(
         job_id=_input_value(state, "job_id"),
-        structured=state.get("structured"),
-        parse_ok=bool(state.get("parse_ok")),
-        parse_repaired=bool(state.get("parse_repaired")),
-        extractor=(state.get("extract_meta") or {}).get("extractor"),
+        structured=structured,
+        parse_ok=bool(em.get("parse_ok", structured is not None)),
+        parse_repaired=bool(em.get("parse_repaired", False)),
+        extractor=em.get("extractor"),
         require_keys=_qc_policy_value(state, "require_keys", []),
         require_non_empty_any_of=_qc_policy_value(state, "require_non_empty_any_of", []),
     )
 
     payload = qc_result.to_dict()
-    state["qc"] = payload
     stage = "fallback" if len(state.get("extraction", {}).get("attempts", [])) > 1 else "primary"
     _append_qc_attempt(state, stage=stage, payload=payload)
 
-    trace = list(state.get("trace", []))
-    trace.append(
-        {
-            "node": "qc",
-            "ok": payload["ok"],
-            "status": payload["status"],
-            "reasons": payload["reasons"],
-        }
-    )
-    state["trace"] = trace
-
-    metrics = dict(state.get("metrics", {}))
-    node_ms = dict(metrics.get("node_ms", {}))
-    node_ms["qc"] = round((time.perf_counter() - started) * 1000, 2)
-    metrics["node_ms"] = node_ms
-    state["metrics"] = metrics
-
-    return state
+    return {
+        "qc": payload,
+        "qc_state": state["qc_state"],
+        "trace": [
+            {
+                "node": "qc",
+                "ok": payload["ok"],
+                "status": payload["status"],
+                "reasons": payload["reasons"],
+            }
+        ],
+        "metrics": _with_node_ms(state, "qc", round((time.perf_counter() - started) * 1000, 2)),
+    }
 
 
-async def node_report(state: GraphState) -> GraphState:
+async def node_report(state: GraphState) -> Dict[str, Any]:
     started = time.perf_counter()
 
     _ensure_v2_state(state)
 
-    svc = ReportService()
-
-    result = await svc.generate(
+    result = await _report_service.generate(
         job_id=_input_value(state, "job_id"),
         structured=state.get("structured") or {},
         qc=state.get("qc") or {},
@@ -454,37 +528,30 @@ async def node_report(state: GraphState) -> GraphState:
 
     payload = result.to_dict()
 
-    state["report_md"] = payload["report_md"]
-    state["report_meta"] = {
-        "meta": payload.get("meta") or {},
-        "usage": payload.get("usage") or {},
-    }
-
     state["report_state"]["report_md"] = payload["report_md"]
     state["report_state"]["meta"] = payload.get("meta") or {}
     state["report_state"]["usage"] = payload.get("usage") or {}
 
-    trace = list(state.get("trace", []))
-    trace.append(
-        {
-            "node": "report",
-            "ok": bool(payload["report_md"].strip()),
-            "provider": state.get("report_provider", "openai"),
-            "model": state.get("report_model"),
-        }
-    )
-    state["trace"] = trace
-
-    metrics = dict(state.get("metrics", {}))
-    node_ms = dict(metrics.get("node_ms", {}))
-    node_ms["report"] = round((time.perf_counter() - started) * 1000, 2)
-    metrics["node_ms"] = node_ms
-    state["metrics"] = metrics
-
-    return state
+    return {
+        "report_md": payload["report_md"],
+        "report_meta": {
+            "meta": payload.get("meta") or {},
+            "usage": payload.get("usage") or {},
+        },
+        "report_state": state["report_state"],
+        "trace": [
+            {
+                "node": "report",
+                "ok": bool(payload["report_md"].strip()),
+                "provider": state.get("report_provider", "openai"),
+                "model": state.get("report_model"),
+            }
+        ],
+        "metrics": _with_node_ms(state, "report", round((time.perf_counter() - started) * 1000, 2)),
+    }
 
 
-async def node_finalize(state: GraphState) -> GraphState:
+async def node_finalize(state: GraphState) -> Dict[str, Any]:
     _ensure_v2_state(state)
 
     if not state["run"].get("route"):
@@ -499,19 +566,33 @@ async def node_finalize(state: GraphState) -> GraphState:
     state["run"]["status"] = "completed"
     state["run"]["ended_at"] = _now()
 
-    _trace(state, "finalize", "ok", route=state["run"]["route"])
-    return state
+    return {
+        "run": state["run"],
+        "trace": [_trace("finalize", "ok", route=state["run"]["route"])],
+    }
 
 
 # -----------------------
 # Routers
 # -----------------------
 
+# Node names returned by the routers and used as conditional-edge keys; interned
+# so LangGraph's branch lookups compare by identity.
+R_EXTRACT_LOCAL = sys.intern("extract_local")
+R_EXTRACT_RACE = sys.intern("extract_race")
+R_EXTRACT_API = sys.intern("extract_api")
+R_REPORT = sys.intern("report")
+R_FINALIZE = sys.intern("finalize")
+
 
 def route_after_fetch(state: GraphState) -> str:
     _ensure_v2_state(state)
     primary_mode = _routing_value(state, "primary_mode", "api")
-    return "extract_local" if primary_mode == "local" else "extract_api"
+    if primary_mode != "local":
+        return R_EXTRACT_API
+    if (state.get("features") or {}).get("speculative_api"):
+        return R_EXTRACT_RACE
+    return R_EXTRACT_LOCAL
 
 
 def route_after_qc(state: GraphState) -> str:
@@ -536,7 +617,7 @@ def route_after_qc(state: GraphState) -> str:
                 "route": route,
             }
         )
-        return "report"
+        return R_REPORT
 
     used_api = extractor.get("provider") in ("openai", "nvidia")
     fallback_enabled = bool(_routing_value(state, "fallback_enabled", True))
@@ -552,7 +633,7 @@ def route_after_qc(state: GraphState) -> str:
                 "route": state["run"]["route"],
             }
         )
-        return "finalize"
+        return R_FINALIZE
 
     state["run"]["route"] = "local_then_api"
     state.setdefault("decisions", []).append(
@@ -564,14 +645,7 @@ def route_after_qc(state: GraphState) -> str:
             "route": state["run"]["route"],
         }
     )
-    return "extract_api"
-
-
-"""
-LangGraph is the primary runtime orchestrator for JobPulse.
-
-This graph calls core services directly and does not depend on MCP tool execution.
-"""
+    return R_EXTRACT_API
 
 
 def build_graph() -> Any:
@@ -579,6 +653,7 @@ def build_graph() -> Any:
 
     g.add_node("fetch", node_fetch_jd)
     g.add_node("extract_local", node_extract_local)
+    g.add_node("extract_race", node_extract_race)
     g.add_node("extract_api", node_extract_api)
     g.add_node("qc", node_qc)
     g.add_node("report", node_report)
@@ -590,21 +665,23 @@ def build_graph() -> Any:
         "fetch",
         route_after_fetch,
         {
-            "extract_local": "extract_local",
-            "extract_api": "extract_api",
+            R_EXTRACT_LOCAL: "extract_local",
+            R_EXTRACT_RACE: "extract_race",
+            R_EXTRACT_API: "extract_api",
         },
     )
 
     g.add_edge("extract_local", "qc")
+    g.add_edge("extract_race", "qc")
     g.add_edge("extract_api", "qc")
 
     g.add_conditional_edges(
         "qc",
         route_after_qc,
         {
-            "report": "report",
-            "extract_api": "extract_api",
-            "finalize": "finalize",
+            R_REPORT: "report",
+            R_EXTRACT_API: "extract_api",
+            R_FINALIZE: "finalize",
         },
     )
 
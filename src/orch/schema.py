@@ -181,7 +181,7 @@ class StoreOutput(TypedDict, total=True):
 # ----------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class JobState:
     job_id: str
     source: Optional[str] = None
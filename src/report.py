@@ -2,61 +2,71 @@ from __future__ import annotations
 
 import sqlite3
 from pathlib import Path
-from typing import List, Tuple
+
+# Fixed statement texts: sqlite3's per-connection statement cache reuses the
+# prepared statements when the report is rebuilt on a long-lived connection.
+_SQL_TOTAL = "SELECT COUNT(*) FROM jobs"
+_SQL_RECENT = "SELECT COUNT(*) FROM jobs WHERE scraped_at_utc >= datetime('now','-7 day')"
+# has_opt_cpt / has_remote are indexed generated columns (see db.migrate)
+_SQL_OPT = "SELECT COUNT(*) FROM jobs WHERE has_opt_cpt = 1"
+_SQL_REMOTE = "SELECT COUNT(*) FROM jobs WHERE has_remote = 1"
+_SQL_TOP_SKILLS = """
+    SELECT skill, COUNT(*) as c
+    FROM job_skills
+    GROUP BY skill
+    ORDER BY c DESC
+    LIMIT 20
+"""
+_SQL_TOP_LOCATIONS = """
+    SELECT COALESCE(location_text,'(unknown)') as loc, COUNT(*) as c
+    FROM jobs
+    GROUP BY loc
+    ORDER BY c DESC
+    LIMIT 10
+"""
 
 
 def build_report(conn: sqlite3.Connection, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
-    recent = conn.execute(
-        "SELECT COUNT(*) FROM jobs WHERE scraped_at_utc >= datetime('now','-7 day')"
-    ).fetchone()[0]
-
-    top_skills: List[Tuple[str, int]] = conn.execute("""
-        SELECT skill, COUNT(*) as c
-        FROM job_skills
-        GROUP BY skill
-        ORDER BY c DESC
-        LIMIT 20
-    """).fetchall()
-
-    top_locations = conn.execute("""
-        SELECT COALESCE(location_text,'(unknown)') as loc, COUNT(*) as c
-        FROM jobs
-        GROUP BY loc
-        ORDER BY c DESC
-        LIMIT 10
-    """).fetchall()
-
-    opt = conn.execute("""
-        SELECT COUNT(*) FROM jobs
-        WHERE LOWER(COALESCE(opt_cpt_text,'')) LIKE '%opt%'
-           OR LOWER(COALESCE(description,'')) LIKE '%opt/cpt%'
-           OR LOWER(COALESCE(description,'')) LIKE '%cpt%'
-    """).fetchone()[0]
-
-    remote = conn.execute("""
-        SELECT COUNT(*) FROM jobs
-        WHERE LOWER(COALESCE(location_text,'')) LIKE '%remote%'
-           OR LOWER(COALESCE(description,'')) LIKE '%work from home%'
-    """).fetchone()[0]
-
-    lines = []
-    lines.append("# JobPulse Weekly Snapshot\n")
-    lines.append(f"- Total jobs in DB: **{total}**")
-    lines.append(f"- Jobs scraped in last 7 days: **{recent}**")
-    lines.append(f"- Jobs mentioning OPT/CPT: **{opt}**")
-    lines.append(f"- Jobs mentioning Remote/WFH: **{remote}**\n")
-
-    lines.append("## Top Skills (from JD text)\n")
-    for s, c in top_skills:
-        lines.append(f"- {s}: {c}")
-    lines.append("")
-
-    lines.append("## Top Locations (raw)\n")
-    for loc, c in top_locations:
-        lines.append(f"- {loc}: {c}")
-    lines.append("")
-
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    # larger page cache + memory-mapped reads for the aggregate scans; the caller's
+    # connection gets its own settings back afterwards
+    old_cache_size = conn.execute("PRAGMA cache_size;").fetchone()[0]
+    old_mmap_size = conn.execute("PRAGMA mmap_size;").fetchone()[0]
+    conn.execute("PRAGMA cache_size=-65536;")
+    conn.execute("PRAGMA mmap_size=268435456;")
+
+    # one read transaction: a single shared lock and a consistent snapshot
+    own_txn = not conn.in_transaction
+    try:
+        if own_txn:
+            conn.execute("BEGIN")
+        try:
+            _write_report(conn, out_path)
+        finally:
+            if own_txn:
+                conn.commit()
+    finally:
+        conn.execute(f"PRAGMA cache_size={int(old_cache_size)};")
+        conn.execute(f"PRAGMA mmap_size={int(old_mmap_size)};")
+
+
+def _write_report(conn: sqlite3.Connection, out_path: Path) -> None:
+    total = conn.execute(_SQL_TOTAL).fetchone()[0]
+    recent = conn.execute(_SQL_RECENT).fetchone()[0]
+    opt = conn.execute(_SQL_OPT).fetchone()[0]
+    remote = conn.execute(_SQL_REMOTE).fetchone()[0]
+
+    # write sections as rows come off the cursors; no intermediate list/joined string
+    with out_path.open("w", encoding="utf-8") as f:
+        f.write("# JobPulse Weekly Snapshot\n\n")
+        f.write(f"- Total jobs in DB: **{total}**\n")
+        f.write(f"- Jobs scraped in last 7 days: **{recent}**\n")
+        f.write(f"- Jobs mentioning OPT/CPT: **{opt}**\n")
+        f.write(f"- Jobs mentioning Remote/WFH: **{remote}**\n\n")
+
+        f.write("## Top Skills (from JD text)\n\n")
+        f.writelines(f"- {s}: {c}\n" for s, c in conn.execute(_SQL_TOP_SKILLS))
+
+        f.write("\n## Top Locations (raw)\n\n")
+        f.writelines(f"- {loc}: {c}\n" for loc, c in conn.execute(_SQL_TOP_LOCATIONS))
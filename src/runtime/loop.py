@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop as the asyncio event loop when it is available (Linux/macOS).
+    Must run before asyncio.run(); returns False and keeps the default loop otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
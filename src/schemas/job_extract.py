@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobExtract(BaseModel):
@@ -9,6 +9,9 @@ class JobExtract(BaseModel):
     This is the contract between LLM extraction and downstream analytics.
     """
 
+    # unknown keys from model output are dropped; instances are read-only once validated
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     role_title: Optional[str] = None
     company: Optional[str] = None
 
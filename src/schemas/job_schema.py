@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, get_args
 
 from pydantic import BaseModel, Field
 
@@ -8,6 +8,12 @@ RoleCategory = Literal["MLE", "DS", "DE", "SWE", "RE", "Other"]
 Seniority = Literal["Intern", "NewGrad", "Junior", "Mid", "Senior", "Staff", "Other"]
 WorkMode = Literal["Remote", "Hybrid", "Onsite", "Unknown"]
 
+_ROLE_CATEGORIES = frozenset(get_args(RoleCategory))
+_SENIORITIES = frozenset(get_args(Seniority))
+_WORK_MODES = frozenset(get_args(WorkMode))
+_VISA_KEYS = ("requires_us_auth", "opt_cpt_ok", "sponsorship_mentioned")
+_LIST_KEYS = ("skills", "requirements", "benefits")
+
 
 class VisaInfo(BaseModel):
     requires_us_auth: bool = False
@@ -29,3 +35,63 @@ class JobStructured(BaseModel):
 
     years_required: Optional[float] = None
     confidence: float = 0.5
+
+    @classmethod
+    def fast_from_llm(cls, d: Dict[str, Any]) -> "JobStructured":
+        """
+        Build from parsed model output, skipping pydantic validation when cheap
+        checks show the dict already conforms (literal enums via frozensets, plain
+        str lists, bool visa flags, real numbers). Anything else goes through
+        model_validate, so the result and errors match the validated constructor.
+        """
+        if not _conforms(d):
+            return cls.model_validate(d)
+
+        visa = d.get("visa", {})
+        years = d.get("years_required")
+        return cls.model_construct(
+            role_category=d.get("role_category", "Other"),
+            seniority=d.get("seniority", "Other"),
+            work_mode=d.get("work_mode", "Unknown"),
+            location=d.get("location"),
+            visa=VisaInfo.model_construct(**{k: visa[k] for k in _VISA_KEYS if k in visa}),
+            skills=list(d.get("skills", ())),
+            requirements=list(d.get("requirements", ())),
+            benefits=list(d.get("benefits", ())),
+            years_required=None if years is None else float(years),
+            confidence=float(d.get("confidence", 0.5)),
+        )
+
+
+def _is_number(v: Any) -> bool:
+    return type(v) in (int, float)
+
+
+def _is_literal(v: Any, allowed: frozenset) -> bool:
+    # type check first: lists/dicts from the model are unhashable
+    return type(v) is str and v in allowed
+
+
+def _conforms(d: Any) -> bool:
+    if type(d) is not dict:
+        return False
+    if not _is_literal(d.get("role_category", "Other"), _ROLE_CATEGORIES):
+        return False
+    if not _is_literal(d.get("seniority", "Other"), _SENIORITIES):
+        return False
+    if not _is_literal(d.get("work_mode", "Unknown"), _WORK_MODES):
+        return False
+    loc = d.get("location")
+    if loc is not None and type(loc) is not str:
+        return False
+    visa = d.get("visa", {})
+    if type(visa) is not dict or any(type(visa.get(k, False)) is not bool for k in _VISA_KEYS):
+        return False
+    for k in _LIST_KEYS:
+        v = d.get(k, [])
+        if type(v) is not list or any(type(x) is not str for x in v):
+            return False
+    years = d.get("years_required")
+    if years is not None and not _is_number(years):
+        return False
+    return _is_number(d.get("confidence", 0.5))
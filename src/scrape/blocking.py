@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from playwright.async_api import BrowserContext, Route
+
+# Only text is read from job pages (h1, job-details block, body inner_text), so
+# pixels and tracking beacons are pure overhead. Stylesheets stay: visibility
+# checks and inner_text depend on computed styles.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+FILTERED_DOMAINS = (
+    "doubleclick.net",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "segment.io",
+    "segment.com",
+    "sentry.io",
+    "hotjar.com",
+    "facebook.net",
+    "connect.facebook.com",
+    "fullstory.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "intercom.io",
+    "newrelic.com",
+    "nr-data.net",
+    "datadoghq.com",
+    "bugsnag.com",
+)
+
+
+async def _route_filter(route: Route) -> None:
+    req = route.request
+    if req.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+    url = req.url
+    if any(d in url for d in FILTERED_DOMAINS):
+        await route.abort()
+        return
+    await route.continue_()
+
+
+async def block_heavy_resources(context: BrowserContext) -> None:
+    """
+    Abort images/fonts/media and analytics requests for every page in the context.
+    Install right after new_context(), before any page navigates.
+    """
+    await context.route("**/*", _route_filter)
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from dataclasses import asdict, dataclass
-from typing import Optional
+from typing import List, Optional, Sequence, Union
 
-from playwright.async_api import Page
+from playwright.async_api import BrowserContext, Locator, Page
+
+_DETAILS_SEL = '[data-hook="job-details-page"]'
+
+_RE_WS_NL = re.compile(r"\s+\n")
+_RE_MULTI_NL = re.compile(r"\n{3,}")
+_RE_MULTI_SP = re.compile(r"[ \t]{2,}")
+
+_RE_SHOW_MORE = re.compile(r"^Show more\b", re.IGNORECASE)
+_RE_SEE_MORE = re.compile(r"^See more\b", re.IGNORECASE)
+_RE_MORE = re.compile(r"^More\b", re.IGNORECASE)
+
+_RE_JOB_ID = re.compile(r"/jobs/(\d+)")
+_RE_POSTED = re.compile(r"Posted\s+(.+?)(?:∙|\u2219)\s*Apply by\s+(.+)$")
+_RE_AT_GLANCE_LINE = re.compile(r"\nAt a glance\n(.+)\n")
+_RE_AT_GLANCE_BLOCK = re.compile(r"\nAt a glance\n(.+\n){1,10}")
+
+_EMPLOYMENT_SET = frozenset({"Internship", "Full-time", "Part-time", "Contract"})
+_DATE_RANGE_PREFIXES = ("Full-time∙From", "Part-time∙From", "From")
 
 
 def _clean(s: str) -> str:
-    s = re.sub(r"\s+\n", "\n", s)
-    s = re.sub(r"\n{3,}", "\n\n", s)
-    s = re.sub(r"[ \t]{2,}", " ", s)
+    s = _RE_WS_NL.sub("\n", s)
+    s = _RE_MULTI_NL.sub("\n\n", s)
+    s = _RE_MULTI_SP.sub(" ", s)
     return s.strip()
 
 
@@ -20,25 +39,29 @@ async def _click_expanders(page: Page) -> None:
     Must not navigate away from the current page.
     """
     candidates = [
-        page.get_by_role("button", name=re.compile(r"^Show more\b", re.IGNORECASE)),
-        page.get_by_role("button", name=re.compile(r"^See more\b", re.IGNORECASE)),
-        page.get_by_role("button", name=re.compile(r"^More\b", re.IGNORECASE)),
+        page.get_by_role("button", name=_RE_SHOW_MORE),
+        page.get_by_role("button", name=_RE_SEE_MORE),
+        page.get_by_role("button", name=_RE_MORE),
     ]
 
     for loc in candidates:
         try:
-            n = min(await loc.count(), 6)
+            # one round-trip; handles stay bound to their elements, unlike nth(i) locators
+            handles = (await loc.element_handles())[:6]
         except Exception:
             continue
 
-        for i in range(n):
+        for handle in handles:
             try:
-                btn = loc.nth(i)
-                if not await btn.is_visible():
+                if not await handle.is_visible():
                     continue
                 before_url = page.url
-                await btn.click(timeout=800)
-                await page.wait_for_timeout(200)
+                await handle.click(timeout=800)
+                try:
+                    # expanders usually disappear once clicked; returns as soon as this one does
+                    await handle.wait_for_element_state("hidden", timeout=1000)
+                except Exception:
+                    pass
                 if page.url != before_url:
                     # hard guard: expander must not navigate
                     raise RuntimeError(
@@ -66,27 +89,15 @@ class JobDetail:
 
 
 def _job_id_from_url(url: str) -> Optional[str]:
-    m = re.search(r"/jobs/(\d+)", url)
+    m = _RE_JOB_ID.search(url)
     return m.group(1) if m else None
 
 
-async def parse_job_detail(page: Page, url: str, timeout_ms: int = 20000) -> JobDetail:
-    await page.goto(url, wait_until="domcontentloaded")
-    try:
-        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
-    except Exception:
-        pass
-
-    await page.wait_for_timeout(500)
-    await _click_expanders(page)
-    await page.wait_for_timeout(300)
-
-    root = page.locator('[data-hook="job-details-page"]')
-    # title
-    title = (await root.locator("h1").first.inner_text()).strip()
-
-    jd = JobDetail(job_id=_job_id_from_url(url), url=url, title=title)
-
+async def _fill_from_dom(root: Locator, jd: JobDetail) -> None:
+    """
+    Structured fields read from the job-details DOM: company, posted/apply-by and
+    the description block under "At a glance". Each field is best-effort.
+    """
     # company: best-effort
     try:
         company = (await root.locator('a[aria-label][href^="/e/"] div').first.inner_text()).strip()
@@ -110,66 +121,127 @@ async def parse_job_detail(page: Page, url: str, timeout_ms: int = 20000) -> Job
             .inner_text()
         ).strip()
 
-        m = re.search(r"Posted\s+(.+?)(?:∙|\u2219)\s*Apply by\s+(.+)$", posted_line)
+        m = _RE_POSTED.search(posted_line)
         jd.posted_text = m.group(1).strip() if m else None
         jd.apply_by_text = m.group(2).strip() if m else None
     except Exception:
         pass
 
-    # description: prefer structured block near "At a glance", fallback to body carving
-    desc = None
+    # description: prefer structured block near "At a glance"; caller falls back to page text
     try:
         at = root.get_by_role("heading", name="At a glance").locator(
             "xpath=ancestor::div[contains(@class,'sc-cYucNP')][1]"
         )
         desc_block = at.locator("xpath=following::div[contains(@class,'sc-cYucNP')][1]")
-        desc = (await desc_block.inner_text()).strip()
+        jd.description = (await desc_block.inner_text()).strip()
     except Exception:
-        desc = None
+        jd.description = None
+
 
-    if not desc:
+def _fill_at_a_glance(jd: JobDetail, text: str) -> None:
+    """
+    Pay, location, work authorization, OPT/CPT, employment type and date range
+    from the "At a glance" lines of the page text.
+    """
+    m = _RE_AT_GLANCE_LINE.search(text)
+    if m:
+        jd.pay_text = m.group(1).strip()
+
+    m = _RE_AT_GLANCE_BLOCK.search(text)
+    if not m:
+        return
+    lines = [x.strip() for x in m.group(0).splitlines() if x.strip()]
+    # lines[0] is the "At a glance" heading itself
+    for ln in lines[1:]:
+        if jd.location_text is None and ("Remote" in ln or "based in" in ln or "," in ln):
+            jd.location_text = ln
+        low = ln.lower()
+        if "work authorization" in low:
+            jd.work_auth_text = ln
+        if "opt/cpt" in low:
+            jd.opt_cpt_text = ln
+        if ln in _EMPLOYMENT_SET:
+            jd.employment_type = ln
+        elif ln.startswith(_DATE_RANGE_PREFIXES):
+            jd.date_range_text = ln
+
+
+async def _page_text(page: Page) -> str:
+    """
+    inner_text of the job-details container rather than the whole <body>: nav,
+    footer and related-job cards are left out. Falls back to <main>, then <body>.
+    """
+    for sel in (_DETAILS_SEL, "main", "body"):
         try:
-            body = await page.locator("body").inner_text()
-            # naive fallback: keep body but clean it; later we can improve by slicing around known headings
-            desc = body
+            loc = page.locator(sel).first
+            if await loc.count():
+                return await loc.inner_text()
         except Exception:
-            desc = ""
+            continue
+    return ""
 
-    jd.description = _clean(desc)
 
-    # optional: parse some “At a glance” fields from body (best-effort)
+async def parse_job_detail(page: Page, url: str, timeout_ms: int = 20000) -> JobDetail:
+    await page.goto(url, wait_until="domcontentloaded")
     try:
-        body = await page.locator("body").inner_text()
-        m = re.search(r"\nAt a glance\n(.+)\n", body)
-        if m:
-            jd.pay_text = m.group(1).strip()
-
-        m = re.search(r"\nAt a glance\n(.+\n){1,10}", body)
-        if m:
-            block = m.group(0)
-            lines = [x.strip() for x in block.splitlines() if x.strip()]
-            for ln in lines:
-                if "Remote" in ln or "based in" in ln or "," in ln:
-                    jd.location_text = ln
-                    break
-            for ln in lines:
-                if "work authorization" in ln.lower():
-                    jd.work_auth_text = ln
-                if "opt/cpt" in ln.lower():
-                    jd.opt_cpt_text = ln
-                if ln in ("Internship", "Full-time", "Part-time", "Contract"):
-                    jd.employment_type = ln
-                if (
-                    ln.startswith("Full-time∙From")
-                    or ln.startswith("Part-time∙From")
-                    or ln.startswith("From")
-                ):
-                    jd.date_range_text = ln
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
     except Exception:
         pass
 
+    root = page.locator(_DETAILS_SEL)
+    # wait for the job header instead of a fixed settle delay
+    title_loc = root.locator("h1").first
+    await title_loc.wait_for(state="visible", timeout=timeout_ms)
+    await _click_expanders(page)
+
+    # title
+    title = (await title_loc.inner_text()).strip()
+
+    jd = JobDetail(job_id=_job_id_from_url(url), url=url, title=title)
+
+    await _fill_from_dom(root, jd)
+
+    # page text is serialized once and shared by the description fallback and "At a glance"
+    body = await _page_text(page)
+
+    if not jd.description:
+        # naive fallback: keep page text but clean it; later we can improve by slicing around known headings
+        jd.description = body
+    jd.description = _clean(jd.description)
+
+    # optional: parse some “At a glance” fields from the page text (best-effort)
+    _fill_at_a_glance(jd, body)
+
     return jd
 
 
+async def parse_many(
+    context: BrowserContext,
+    urls: Sequence[str],
+    concurrency: int = 5,
+    timeout_ms: int = 20000,
+) -> List[Union[JobDetail, Exception]]:
+    """
+    Parse several job pages concurrently inside one BrowserContext.
+    Each URL gets its own page (closed afterwards to release DOM memory); at most
+    `concurrency` pages are open at once. Duplicate URLs are fetched once. Results
+    keep input order; a failed URL yields its exception instead of aborting the batch.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(url: str) -> JobDetail:
+        async with sem:
+            page = await context.new_page()
+            try:
+                return await parse_job_detail(page, url, timeout_ms=timeout_ms)
+            finally:
+                await page.close()
+
+    unique = list(dict.fromkeys(urls))
+    results = await asyncio.gather(*(_one(u) for u in unique), return_exceptions=True)
+    by_url = dict(zip(unique, results))
+    return [by_url[u] for u in urls]
+
+
 def to_dict(jd: JobDetail) -> dict:
     return asdict(jd)
@@ -1,36 +1,49 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from typing import Dict, List
 
-from playwright.async_api import Page
+from playwright.async_api import BrowserContext, Page
 
 BASE = "https://app.joinhandshake.com"
 
 _JOB_RE = re.compile(r"^/jobs/(\d+)\b")
+_JOB_LINK_SEL = 'a[href^="/jobs/"]'
+# anchor wait used only when networkidle timed out; a settled empty page needs none
+_ANCHOR_WAIT_MS = 2000
 
 
-async def collect_job_links(
-    page: Page, pages: int = 1, per_page: int = 25, timeout_ms: int = 15000
-) -> List[Dict[str, str]]:
-    out: List[Dict[str, str]] = []
-    seen = set()
+def _search_url(p: int, per_page: int) -> str:
+    return f"{BASE}/job-search?page={p}&per_page={per_page}"
 
-    for p in range(1, pages + 1):
-        url = f"{BASE}/job-search?page={p}&per_page={per_page}"
-        await page.goto(url, wait_until="domcontentloaded")
+
+async def _page_hrefs(page: Page, url: str, timeout_ms: int) -> List[str]:
+    await page.goto(url, wait_until="domcontentloaded")
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+    except Exception:
+        # Best-effort, avoid hard failure on flaky network; give anchors a short extra window
         try:
-            await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+            await page.locator(_JOB_LINK_SEL).first.wait_for(
+                state="attached", timeout=_ANCHOR_WAIT_MS
+            )
         except Exception:
-            # Best-effort, avoid hard failure on flaky network
+            # empty result page: fall through with zero anchors
             pass
 
-        # anchor hrefs
-        loc = page.locator('a[href^="/jobs/"]')
-        n = await loc.count()
-        for i in range(n):
-            href = (await loc.nth(i).get_attribute("href")) or ""
-            m = _JOB_RE.match(href)
+    # anchor hrefs: all in one round-trip instead of count() + get_attribute() per anchor
+    return await page.eval_on_selector_all(
+        _JOB_LINK_SEL, "els => els.map(e => e.getAttribute('href'))"
+    )
+
+
+def _dedupe_links(href_lists: List[List[str]]) -> List[Dict[str, str]]:
+    out: List[Dict[str, str]] = []
+    seen = set()
+    for hrefs in href_lists:
+        for href in hrefs:
+            m = _JOB_RE.match(href or "")
             if not m:
                 continue
             job_id = m.group(1)
@@ -39,5 +52,39 @@ async def collect_job_links(
                 continue
             seen.add(clean)
             out.append({"job_id": job_id, "url": clean})
-
     return out
+
+
+async def collect_job_links(
+    page: Page, pages: int = 1, per_page: int = 25, timeout_ms: int = 15000
+) -> List[Dict[str, str]]:
+    href_lists = []
+    for p in range(1, pages + 1):
+        href_lists.append(await _page_hrefs(page, _search_url(p, per_page), timeout_ms))
+    return _dedupe_links(href_lists)
+
+
+async def collect_job_links_many(
+    context: BrowserContext,
+    pages: int = 1,
+    per_page: int = 25,
+    timeout_ms: int = 15000,
+    concurrency: int = 3,
+) -> List[Dict[str, str]]:
+    """
+    Same output as collect_job_links, but search-result pages are loaded
+    concurrently, each in its own page of `context` (at most `concurrency` open).
+    Links keep result-page order.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(p: int) -> List[str]:
+        async with sem:
+            page = await context.new_page()
+            try:
+                return await _page_hrefs(page, _search_url(p, per_page), timeout_ms)
+            finally:
+                await page.close()
+
+    href_lists = await asyncio.gather(*(_one(p) for p in range(1, pages + 1)))
+    return _dedupe_links(list(href_lists))
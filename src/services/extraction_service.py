@@ -1,31 +1,19 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from dataclasses import asdict, dataclass
-from pathlib import Path
 from typing import Any, Dict, Literal, Optional
 
+import orjson
+
 from src.llm.json_repair import parse_json_object
+from src.llm.json_stream import collect_json_stream
+from src.llm.prompt_templates import build_prompt, trim_jd_text
 from src.llm.providers.hf_chat_lora import HFChatLoRAExtractor
 from src.llm.providers.hf_plain import HFPlainExtractor
-from src.llm.providers.openai_compat_client import OpenAICompatClient
+from src.llm.providers.openai_compat_client import get_client
 from src.llm.providers.openai_compat_providers import PROVIDERS
 
-PROMPTS = {
-    "jd_extract_v1": Path("src/llm/prompts/jd_extract_v1.txt"),
-    "jd_extract_v2": Path("src/llm/prompts/jd_extract_v2.txt"),
-    "jd_extract_v3": Path("src/llm/prompts/jd_extract_v3.txt"),
-}
-
-
-def _build_prompt(prompt_name: str, jd_text: str) -> str:
-    template = PROMPTS[prompt_name].read_text(encoding="utf-8", errors="ignore")
-    # Assert check: Ensure the template contains the placeholder and that it gets replaced
-    assert "{{JOB_DESCRIPTION}}" in template, "Prompt template missing {{JOB_DESCRIPTION}}"
-    prompt = template.replace("{{JOB_DESCRIPTION}}", jd_text)
-    assert "{{JOB_DESCRIPTION}}" not in prompt, "Placeholder not replaced"
-    return prompt
-
 
 def _get_message_text(resp: Dict[str, Any]) -> str:
     """
@@ -119,7 +107,7 @@ class ExtractionService:
         May not used when deploying in cloud (due to GPU requirements)
         """
 
-        prompt = _build_prompt(prompt_name, jd_text)
+        prompt = build_prompt(prompt_name, jd_text)
 
         do_sample = bool(temperature and temperature > 0)
 
@@ -135,33 +123,37 @@ class ExtractionService:
             "seed": seed,
         }
 
-        if mode == "plain":
-            extractor = HFPlainExtractor(
-                model_name=model,
-                device=device,
-                max_new_tokens=max_tokens,
-                do_sample=do_sample,
-                temperature=temperature,
-                top_p=top_p,
-                top_k=top_k,
-                seed=seed,
-            )
-        elif mode == "chat_lora":
-            extractor = HFChatLoRAExtractor(
-                base_model=model,
-                lora_path=lora_path,
-                device=device,
-                max_new_tokens=max_tokens,
-                do_sample=do_sample,
-                temperature=temperature,
-                top_p=top_p,
-                top_k=top_k,
-                seed=seed,
-            )
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
-
-        result = extractor.extract_with_result(prompt)
+        def _run() -> Any:
+            if mode == "plain":
+                extractor = HFPlainExtractor(
+                    model_name=model,
+                    device=device,
+                    max_new_tokens=max_tokens,
+                    do_sample=do_sample,
+                    temperature=temperature,
+                    top_p=top_p,
+                    top_k=top_k,
+                    seed=seed,
+                )
+            elif mode == "chat_lora":
+                extractor = HFChatLoRAExtractor(
+                    base_model=model,
+                    lora_path=lora_path,
+                    device=device,
+                    max_new_tokens=max_tokens,
+                    do_sample=do_sample,
+                    temperature=temperature,
+                    top_p=top_p,
+                    top_k=top_k,
+                    seed=seed,
+                )
+            else:
+                raise ValueError(f"Unknown mode: {mode}")
+
+            return extractor.extract_with_result(prompt)
+
+        # model load and generation are blocking; keep them off the event loop
+        result = await asyncio.to_thread(_run)
         parse_ok = result.error is None and result.data is not None
 
         return ExtractResult(
@@ -183,11 +175,19 @@ class ExtractionService:
         temperature: float = 0.6,
         max_tokens: int = 900,
         thinking: Literal["auto", "disabled", "enabled"] = "disabled",
+        stream: bool = False,
+        max_jd_tokens: Optional[int] = 6000,
     ) -> ExtractResult:
         """
         Extraction using an OpenAI-compatible API provider.
         Providers supported: openai, nvidia.
 
+        stream=True reads the completion incrementally and stops as soon as the
+        JSON object closes; a truncated stream is parsed as partial JSON.
+
+        max_jd_tokens caps the JD (approximately, by characters) before it is
+        inlined into the prompt; None disables trimming.
+
         Env:
         OPENAI_API_KEY for provider=openai
         NVIDIA_API_KEY for provider=nvidia
@@ -200,7 +200,7 @@ class ExtractionService:
         if model is None:
             model = cfg.default_model
 
-        prompt = _build_prompt(prompt_name, jd_text)
+        prompt = build_prompt(prompt_name, trim_jd_text(jd_text, max_jd_tokens))
 
         system = (
             "You are an information extraction system. "
@@ -233,17 +233,40 @@ class ExtractionService:
                 "extra_body", None
             )  # OpenAI doesn't support thinking control (ignore if present)
 
-        client = OpenAICompatClient(provider=prov)
-        resp = await client.chat_completions(payload)
+        # JSON mode: the provider guarantees a bare JSON object (no fences/prose);
+        # repair still covers outputs truncated by max_tokens.
+        if cfg.supports_json_mode:
+            payload["response_format"] = {"type": "json_object"}
+
+        client = get_client(prov)
+
+        if stream:
+            if provider == "openai":
+                payload["stream_options"] = {"include_usage": True}
+            streamed = await collect_json_stream(
+                client.chat_completions_stream(payload),
+                wait_for_usage="stream_options" in payload,
+            )
+            content = streamed.text
+            usage = streamed.usage
+            if streamed.complete:
+                parsed, repaired_flag = streamed.parsed, False
+            elif streamed.parsed is not None:
+                parsed, repaired_flag = streamed.parsed, True
+            else:
+                parsed, repaired_flag, _ = parse_json_object(content)
+        else:
+            resp = await client.chat_completions(payload)
+
+            content = _get_message_text(resp)
+            usage = resp.get("usage", {})
 
-        content = _get_message_text(resp)
-        usage = resp.get("usage", {})
+            # If provider returned no content, keep the full response for debugging
+            if not content.strip():
+                content = orjson.dumps(resp).decode("utf-8")
 
-        # If provider returned no content, keep the full response for debugging
-        if not content.strip():
-            content = json.dumps(resp, ensure_ascii=False)
+            parsed, repaired_flag, _ = parse_json_object(content)
 
-        parsed, repaired_flag, used_text = parse_json_object(content)
         parse_ok = parsed is not None
 
         extractor_meta = {
@@ -252,6 +275,8 @@ class ExtractionService:
             "temperature": temperature,
             "max_tokens": max_tokens,
             "thinking": effective_thinking,
+            "stream": stream,
+            "json_mode": cfg.supports_json_mode,
             "base_url": client.base_url,
         }
 
@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import asdict, dataclass
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from src.db import get_conn, init_db
 
 
+@lru_cache(maxsize=1)
+def _ensure_db() -> None:
+    # schema/migrations are idempotent; run them once per process, not per fetch
+    init_db()
+
+
 @dataclass
 class JobFetchResult:
     job_id: str
@@ -38,10 +45,9 @@ class JobFetchService:
         raise ValueError(f"Unsupported source: {source}")
 
     async def _fetch_handshake(self, job_id: str) -> JobFetchResult:
+        _ensure_db()
         conn = get_conn()
         try:
-            init_db()
-
             row = conn.execute(
                 """
                 SELECT job_id, description
@@ -4,7 +4,7 @@ from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Literal, Optional
 
 from src.llm.json_repair import parse_json_object
-from src.llm.providers.openai_compat_client import OpenAICompatClient
+from src.llm.providers.openai_compat_client import get_client
 from src.llm.providers.openai_compat_providers import PROVIDERS
 from src.services.job_market_chat_prompt import build_job_market_chat_messages
 from src.services.job_search_service import JobSearchService
@@ -270,7 +270,7 @@ class JobMarketChatService:
         if provider == "openai":
             payload.pop("extra_body", None)
 
-        client = OpenAICompatClient(provider=prov)
+        client = get_client(prov)
         resp = await client.chat_completions(payload)
 
         raw_output = self._get_message_text(resp)
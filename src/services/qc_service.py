@@ -59,11 +59,10 @@ class QCService:
             if missing_required_keys:
                 reasons.append("missing_required_keys")
 
-            failed_groups: List[List[str]] = []
-            for group in require_non_empty_any_of:
-                passed = any(self._is_non_empty(structured.get(k)) for k in group)
-                if not passed:
-                    failed_groups.append(group)
+            non_empty = {k for k, v in structured.items() if self._is_non_empty(v)}
+            failed_groups: List[List[str]] = [
+                group for group in require_non_empty_any_of if non_empty.isdisjoint(group)
+            ]
 
             checks["failed_non_empty_groups"] = failed_groups
             if failed_groups:
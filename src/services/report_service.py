@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, Optional
 
-from src.llm.providers.openai_compat_client import OpenAICompatClient
+import orjson
+
+from src.llm.providers.openai_compat_client import get_client
 from src.llm.providers.openai_compat_providers import PROVIDERS
 
+_PRETTY_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 
 @dataclass
 class ReportResult:
@@ -125,7 +128,7 @@ class ReportService:
         if not model:
             raise ValueError(f"No model resolved for provider={provider}")
 
-        client = OpenAICompatClient(provider=prov)
+        client = get_client(prov)
 
         payload = {
             "model": model,
@@ -220,7 +223,7 @@ class ReportService:
         )
 
     def _to_pretty_json(self, obj: Any) -> str:
-        return json.dumps(obj, ensure_ascii=False, indent=2)
+        return orjson.dumps(obj, option=_PRETTY_JSON_OPTS).decode("utf-8")
 
     def _get_message_text(self, resp: Dict[str, Any]) -> str:
         try:
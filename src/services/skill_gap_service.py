@@ -5,7 +5,7 @@ from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Literal, Optional
 
 from src.llm.json_repair import parse_json_object
-from src.llm.providers.openai_compat_client import OpenAICompatClient
+from src.llm.providers.openai_compat_client import get_client
 from src.llm.providers.openai_compat_providers import PROVIDERS
 from src.schemas.skill_gap import (
     EvidenceItem,
@@ -484,7 +484,7 @@ class SkillGapService:
         if provider == "openai":
             payload.pop("extra_body", None)
 
-        client = OpenAICompatClient(provider=prov)
+        client = get_client(prov)
         resp = await client.chat_completions(payload)
 
         raw_output = self._get_message_text(resp)
@@ -1,5 +1,5 @@
 import re
-from typing import Iterable
+from typing import Iterable, Optional, Pattern, Union
 
 DEFAULT_DROP_PATTERNS: list[str] = [
     r"^\s*Apply\s*$",
@@ -12,31 +12,70 @@ DEFAULT_DROP_PATTERNS: list[str] = [
     r"^\s*Handshake\s*$",
 ]
 
+# DEFAULT_DROP_PATTERNS fused into one alternation: one regex scan per line instead of eight
+_DROP_RE = re.compile(
+    r"^\s*(?:Apply|Apply by.*|Posted\s+.*|At a glance|Show more|See more|More|Handshake)\s*$",
+    re.IGNORECASE,
+)
+
+_RE_SPACES = re.compile(r"[ \t]+")
+_RE_MULTI_NL = re.compile(r"\n{3,}")
+
 
 def normalize_whitespace(text: str) -> str:
     text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _RE_SPACES.sub(" ", text)
+    text = _RE_MULTI_NL.sub("\n\n", text)
     return text.strip()
 
 
-def drop_noisy_lines(text: str, drop_patterns: Iterable[str] = DEFAULT_DROP_PATTERNS) -> str:
-    pats = [re.compile(p, re.IGNORECASE) for p in drop_patterns]
+def drop_noisy_lines(
+    text: str, drop_patterns: Optional[Iterable[Union[str, Pattern[str]]]] = None
+) -> str:
+    if drop_patterns is None:
+        is_noise = _DROP_RE.match
+    else:
+        # custom patterns: raw strings are compiled case-insensitively, compiled ones used as given
+        pats = [
+            p if isinstance(p, re.Pattern) else re.compile(p, re.IGNORECASE) for p in drop_patterns
+        ]
+
+        def is_noise(s: str) -> bool:
+            return any(p.search(s) for p in pats)
+
     kept: list[str] = []
     for line in text.split("\n"):
         s = line.strip()
         if not s:
             kept.append("")
             continue
-        if any(p.search(s) for p in pats):
+        if is_noise(s):
             continue
         kept.append(line)
     out = "\n".join(kept)
-    out = re.sub(r"\n{3,}", "\n\n", out)
+    out = _RE_MULTI_NL.sub("\n\n", out)
     return out.strip()
 
 
 def clean_jd(raw_text: str) -> str:
-    text = normalize_whitespace(raw_text)
-    text = drop_noisy_lines(text)
-    return text
+    """
+    normalize_whitespace + drop_noisy_lines in a single pass over the lines:
+    spaces/tabs collapsed, noise lines dropped, blank runs coalesced to one.
+    """
+    out: list[str] = []
+    prev_blank = False
+    for line in raw_text.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        # collapse before matching, as normalize_whitespace runs ahead of drop_noisy_lines
+        if "  " in line or "\t" in line:
+            line = _RE_SPACES.sub(" ", line)
+        s = line.strip()
+        if not s:
+            if not prev_blank:
+                out.append("")
+                prev_blank = True
+            continue
+        if _DROP_RE.match(s):
+            continue
+        prev_blank = False
+        out.append(line)
+    return "\n".join(out).strip()
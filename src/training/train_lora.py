@@ -1,14 +1,16 @@
+import hashlib
 import json
 import os
 from pathlib import Path
 
 import torch
-from datasets import load_dataset
-from peft import LoraConfig, get_peft_model
+from datasets import load_dataset, load_from_disk
+from peft import LoraConfig, get_peft_model, prepare_model_for_kbit_training
 from transformers import (
     AutoModelForCausalLM,
     AutoTokenizer,
-    DataCollatorForLanguageModeling,
+    BitsAndBytesConfig,
+    DataCollatorForSeq2Seq,
     Trainer,
     TrainingArguments,
 )
@@ -22,42 +24,85 @@ OUT_DIR = "models/qwen2.5-0.5b-jd-lora"
 MAX_LENGTH = 512  # keep conservative for 8GB
 EPOCHS = 3
 LR = 2e-4
-BATCH_SIZE = 1
-GRAD_ACCUM = 8
+BATCH_SIZE = 2
+GRAD_ACCUM = 4
+LOAD_IN_4BIT = True  # QLoRA: nf4 base weights (bitsandbytes), LoRA adapters in higher precision
+LORA_TARGETS = ["q_proj", "k_proj", "v_proj", "o_proj", "gate_proj", "up_proj", "down_proj"]
 WARMUP_RATIO = 0.03
 SEED = 42
+NUM_PROC = min(os.cpu_count() or 1, 8)  # worker processes for dataset tokenization
 # =======================================
 
 
-def messages_to_text(example, tokenizer):
+def _render(msgs, tokenizer, add_generation_prompt: bool) -> str:
+    # Use chat template if model/tokenizer supports it
+    if getattr(tokenizer, "chat_template", None):
+        return tokenizer.apply_chat_template(
+            msgs, tokenize=False, add_generation_prompt=add_generation_prompt
+        )
+    # Fallback: simple concatenation
+    text = "\n".join(f"{m['role'].upper()}:\n{m['content']}\n" for m in msgs)
+    if add_generation_prompt:
+        text += "\nASSISTANT:\n"
+    return text
+
+
+def tokenize_with_mask(example, tokenizer):
     """
-    Convert messages format to a single chat string using the tokenizer's chat template (if available).
+    Tokenize one chat example for causal-LM training with loss only on the reply:
+    prompt positions (system + user + generation header) get label -100.
     """
     msgs = example["messages"]
     # Ensure assistant content exists (train/val should have it)
     if not msgs or msgs[-1]["role"] != "assistant":
         raise ValueError("Invalid example: messages must end with assistant")
 
-    # Use chat template if model/tokenizer supports it
-    if hasattr(tokenizer, "apply_chat_template"):
-        text = tokenizer.apply_chat_template(msgs, tokenize=False, add_generation_prompt=False)
-    else:
-        # Fallback: simple concatenation
-        parts = []
-        for m in msgs:
-            parts.append(f"{m['role'].upper()}:\n{m['content']}\n")
-        text = "\n".join(parts)
-    return {"text": text}
-
-
-def tokenize_fn(example, tokenizer):
-    out = tokenizer(
-        example["text"],
-        truncation=True,
-        max_length=MAX_LENGTH,
-        return_tensors=None,
+    prompt_text = _render(msgs[:-1], tokenizer, add_generation_prompt=True)
+    full_text = _render(msgs, tokenizer, add_generation_prompt=False)
+
+    prompt_len = len(tokenizer(prompt_text)["input_ids"])
+    enc = tokenizer(full_text, truncation=True, max_length=MAX_LENGTH)
+    input_ids = enc["input_ids"]
+
+    n_masked = min(prompt_len, len(input_ids))
+    labels = [-100] * n_masked + input_ids[n_masked:]
+    return {"input_ids": input_ids, "attention_mask": enc["attention_mask"], "labels": labels}
+
+
+# bump when tokenize_with_mask's output columns change
+_TOK_FORMAT = 2
+
+
+def _tok_cache_dir() -> Path:
+    # keyed on everything that changes the tokenized output
+    h = hashlib.sha1(f"{_TOK_FORMAT}|{BASE_MODEL}|{MAX_LENGTH}".encode("utf-8"))
+    for path in (TRAIN_PATH, VAL_PATH):
+        h.update(Path(path).read_bytes())
+    return Path(OUT_DIR, "tok_cache", h.hexdigest()[:16])
+
+
+def load_tokenized(tokenizer):
+    """
+    Tokenized train/validation splits, reused from OUT_DIR/tok_cache across runs
+    (e.g. hyperparameter sweeps) while the base model, MAX_LENGTH and data are unchanged.
+    """
+    cache_dir = _tok_cache_dir()
+    if cache_dir.exists():
+        return load_from_disk(str(cache_dir))
+
+    ds = load_dataset("json", data_files={"train": TRAIN_PATH, "validation": VAL_PATH})
+
+    # Render chat + tokenize, masking prompt tokens out of the loss
+    ds = ds.map(
+        lambda x: tokenize_with_mask(x, tokenizer),
+        remove_columns=ds["train"].column_names,
+        num_proc=NUM_PROC,
     )
-    return out
+    # prompts that fill MAX_LENGTH leave nothing to learn from
+    ds = ds.filter(lambda x: any(t != -100 for t in x["labels"]), num_proc=NUM_PROC)
+
+    ds.save_to_disk(str(cache_dir))
+    return ds
 
 
 def main():
@@ -67,12 +112,32 @@ def main():
     if tokenizer.pad_token is None:
         tokenizer.pad_token = tokenizer.eos_token
 
+    use_bf16 = torch.cuda.is_available() and torch.cuda.is_bf16_supported()
+    compute_dtype = torch.bfloat16 if use_bf16 else torch.float16
+
+    bnb_config = None
+    if LOAD_IN_4BIT:
+        bnb_config = BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_use_double_quant=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_compute_dtype=compute_dtype,
+        )
+
     model = AutoModelForCausalLM.from_pretrained(
         BASE_MODEL,
-        dtype=torch.float16,
+        dtype=compute_dtype,
         device_map="auto",
         trust_remote_code=True,
+        quantization_config=bnb_config,
+        attn_implementation="sdpa",  # fused attention kernel; no flash-attn build needed
     )
+    if LOAD_IN_4BIT:
+        # casts norms to fp32 and enables gradient checkpointing + input grads for k-bit training
+        model = prepare_model_for_kbit_training(model, use_gradient_checkpointing=True)
+    else:
+        model.gradient_checkpointing_enable()
+        model.enable_input_require_grads()
 
     # LoRA config: keep small and stable
     lora = LoraConfig(
@@ -81,20 +146,15 @@ def main():
         lora_dropout=0.05,
         bias="none",
         task_type="CAUSAL_LM",
-        target_modules=["q_proj", "v_proj"],  # common for Qwen
+        target_modules=LORA_TARGETS,  # all attention + MLP projections in Qwen blocks
     )
     model = get_peft_model(model, lora)
     model.print_trainable_parameters()
 
-    ds = load_dataset("json", data_files={"train": TRAIN_PATH, "validation": VAL_PATH})
-
-    # Convert messages -> text
-    ds = ds.map(lambda x: messages_to_text(x, tokenizer), remove_columns=ds["train"].column_names)
-
-    # Tokenize
-    ds = ds.map(lambda x: tokenize_fn(x, tokenizer), batched=True)
+    ds = load_tokenized(tokenizer)
 
-    collator = DataCollatorForLanguageModeling(tokenizer=tokenizer, mlm=False)
+    # pads input_ids/attention_mask/labels to the longest sequence in each batch
+    collator = DataCollatorForSeq2Seq(tokenizer=tokenizer, padding=True, label_pad_token_id=-100)
 
     args = TrainingArguments(
         output_dir=OUT_DIR,
@@ -103,15 +163,21 @@ def main():
         per_device_train_batch_size=BATCH_SIZE,
         per_device_eval_batch_size=1,
         gradient_accumulation_steps=GRAD_ACCUM,
+        # batch examples of similar length so dynamic padding adds few pad tokens;
+        # the sampler takes lengths from input_ids
+        group_by_length=True,
         warmup_ratio=WARMUP_RATIO,
         logging_steps=10,
         eval_strategy="epoch",
         save_strategy="epoch",
         save_total_limit=2,
-        fp16=True,
+        bf16=use_bf16,
+        fp16=not use_bf16,
+        gradient_checkpointing=True,
+        gradient_checkpointing_kwargs={"use_reentrant": False},
         seed=SEED,
         report_to="none",
-        optim="adamw_torch",
+        optim="paged_adamw_8bit" if LOAD_IN_4BIT else "adamw_torch",
         lr_scheduler_type="cosine",
         weight_decay=0.0,
         max_grad_norm=1.0,
@@ -139,6 +205,8 @@ def main():
         "lr": LR,
         "batch_size": BATCH_SIZE,
         "grad_accum": GRAD_ACCUM,
+        "load_in_4bit": LOAD_IN_4BIT,
+        "lora_targets": LORA_TARGETS,
         "train_size": len(ds["train"]),
         "val_size": len(ds["validation"]),
     }
@@ -0,0 +1,24 @@
+from src.text_clean.jd_clean import clean_jd, drop_noisy_lines, normalize_whitespace
+
+
+def test_clean_jd_matches_two_pass_pipeline():
+    raw = (
+        "\r\n  Handshake\r\nML  Engineer\t Intern\n\n\n\nPosted 2 days ago\n"
+        "Apply by May 3\n   \nAt a glance\n\nShow more\n\nBuild models.\nApply\n"
+    )
+
+    assert clean_jd(raw) == drop_noisy_lines(normalize_whitespace(raw))
+    assert clean_jd(raw) == "ML Engineer Intern\n\nBuild models."
+
+
+def test_clean_jd_keeps_lines_that_only_start_like_noise():
+    text = "More info below\nApplying ML\nPosted"
+
+    assert clean_jd(text) == text
+
+
+def test_clean_jd_drops_noise_lines_with_inner_space_runs():
+    raw = "Intro\nShow  more\nApply\tby May 3\nAt  a glance\n\tSee \t more \nBody  text"
+
+    assert clean_jd(raw) == drop_noisy_lines(normalize_whitespace(raw))
+    assert clean_jd(raw) == "Intro\nBody text"
@@ -0,0 +1,33 @@
+import pytest
+from pydantic import ValidationError
+
+from src.schemas.job_schema import JobStructured
+
+
+def test_fast_from_llm_matches_validated_constructor():
+    data = {
+        "role_category": "MLE",
+        "work_mode": "Remote",
+        "visa": {"opt_cpt_ok": True},
+        "skills": ["python", "pytorch"],
+        "years_required": 2,
+        "confidence": 1,
+        "unknown_key": "dropped",
+    }
+
+    fast = JobStructured.fast_from_llm(data)
+
+    assert fast == JobStructured.model_validate(data)
+    assert fast.years_required == 2.0 and isinstance(fast.years_required, float)
+
+
+def test_fast_from_llm_falls_back_to_validation():
+    with pytest.raises(ValidationError):
+        JobStructured.fast_from_llm({"role_category": "Astronaut"})
+    with pytest.raises(ValidationError):
+        JobStructured.fast_from_llm({"role_category": ["MLE"]})
+    with pytest.raises(ValidationError):
+        JobStructured.fast_from_llm({"work_mode": {"value": "Remote"}})
+
+    coerced = JobStructured.fast_from_llm({"years_required": "3"})
+    assert coerced.years_required == 3.0
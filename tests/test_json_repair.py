@@ -0,0 +1,41 @@
+from src.llm.json_repair import parse_json_object, repair_brackets, truncate_to_last_balanced
+
+
+def test_parse_json_object_as_is():
+    obj, repaired, used = parse_json_object('{"role_title": "MLE", "skills": ["python"]}')
+
+    assert obj == {"role_title": "MLE", "skills": ["python"]}
+    assert repaired is False
+    assert used.startswith("{")
+
+
+def test_truncate_to_last_balanced_drops_trailing_text():
+    truncated, stack = truncate_to_last_balanced('{"a": [1, 2]} trailing notes')
+
+    assert truncated == '{"a": [1, 2]}'
+    assert stack == []
+
+
+def test_truncate_to_last_balanced_reports_open_brackets():
+    truncated, stack = truncate_to_last_balanced('{"a": [1, {"b": "}"')
+
+    assert truncated is None
+    assert stack == ["{", "[", "{"]
+
+
+def test_repair_brackets_closes_truncated_output():
+    text = '```json\n{"requirements": ["SQL", "Python"'
+
+    assert repair_brackets(text) == '{"requirements": ["SQL", "Python"]}'
+
+
+def test_repair_brackets_keeps_leading_json_untouched():
+    assert repair_brackets('  {"a": {"b": 1}} extra') == '{"a": {"b": 1}}'
+    assert repair_brackets('  [{"a": 1}') == '[{"a": 1}]'
+
+
+def test_parse_json_object_repairs_truncated_output():
+    obj, repaired, _ = parse_json_object('Here you go: {"skills": ["a", "b"')
+
+    assert obj == {"skills": ["a", "b"]}
+    assert repaired is True
@@ -0,0 +1,53 @@
+import asyncio
+
+from src.llm.json_stream import JsonStreamTracker, collect_json_stream, parse_partial_json_object
+
+
+def _chunks(*deltas):
+    async def gen():
+        for d in deltas:
+            yield {"choices": [{"delta": {"content": d}}]}
+        yield {"choices": [], "usage": {"total_tokens": 42}}
+
+    return gen()
+
+
+def test_tracker_ignores_brackets_inside_strings():
+    tracker = JsonStreamTracker()
+
+    assert tracker.feed('{"a": "}]') is False
+    assert tracker.feed('", "b": [1]}') is True
+    assert tracker.value_text() == '{"a": "}]", "b": [1]}'
+
+
+def test_collect_json_stream_stops_when_object_closes():
+    result = asyncio.run(
+        collect_json_stream(_chunks('Sure: {"skills": ["py', 'thon"]} trailing', " more"))
+    )
+
+    assert result.complete is True
+    assert result.parsed == {"skills": ["python"]}
+    assert result.text == 'Sure: {"skills": ["python"]} trailing'
+    assert result.usage == {}
+
+
+def test_collect_json_stream_drains_for_usage_after_close():
+    result = asyncio.run(
+        collect_json_stream(_chunks('{"skills": []} tail', " more"), wait_for_usage=True)
+    )
+
+    assert result.complete is True
+    assert result.text == '{"skills": []} tail'
+    assert result.usage == {"total_tokens": 42}
+
+
+def test_collect_json_stream_parses_truncated_output():
+    result = asyncio.run(collect_json_stream(_chunks('{"role_title": "ML', " Engineer")))
+
+    assert result.complete is False
+    assert result.parsed == {"role_title": "ML Engineer"}
+    assert result.usage == {"total_tokens": 42}
+
+
+def test_parse_partial_json_object_without_object():
+    assert parse_partial_json_object("no json here") is None
@@ -0,0 +1,18 @@
+import asyncio
+
+from src.llm.providers.openai_compat_client import OpenAICompatClient
+
+
+def test_aclose_closes_the_running_loops_client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    client = OpenAICompatClient("openai")
+
+    async def run():
+        http = client._http()
+        assert client._http() is http
+        await client.aclose()
+        assert http.is_closed
+        assert client._http() is not http
+        await client.aclose()
+
+    asyncio.run(run())
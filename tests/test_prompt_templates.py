@@ -0,0 +1,22 @@
+from src.llm.prompt_templates import PLACEHOLDER, build_prompt, trim_jd_text
+
+
+def test_build_prompt_inlines_jd_text():
+    prompt = build_prompt("jd_extract_v2", "JD-BODY-MARKER")
+
+    assert prompt.count("JD-BODY-MARKER") == 1
+    assert PLACEHOLDER not in prompt
+
+
+def test_trim_jd_text_keeps_short_text():
+    assert trim_jd_text("short jd", max_tokens=10) == "short jd"
+    assert trim_jd_text("x" * 100, max_tokens=None) == "x" * 100
+
+
+def test_trim_jd_text_keeps_head_and_tail():
+    text = "H" * 50 + "M" * 100 + "T" * 50
+    trimmed = trim_jd_text(text, max_tokens=20)  # 80 chars
+
+    assert trimmed.startswith("H" * 50)
+    assert trimmed.endswith("T" * 24)
+    assert len(trimmed) == 80 + len("\n...\n")
@@ -0,0 +1,24 @@
+import asyncio
+import sys
+
+import pytest
+
+from src.runtime.loop import install_uvloop
+
+
+def test_install_uvloop_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)  # makes `import uvloop` raise ImportError
+    policy = asyncio.get_event_loop_policy()
+
+    assert install_uvloop() is False
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_install_uvloop_sets_policy():
+    uvloop = pytest.importorskip("uvloop")
+    policy = asyncio.get_event_loop_policy()
+    try:
+        assert install_uvloop() is True
+        assert isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+    finally:
+        asyncio.set_event_loop_policy(policy)
@@ -0,0 +1,25 @@
+from src.scrape.detail import JobDetail, _fill_at_a_glance
+
+BODY = (
+    "Nav\nAt a glance\n$30–40/hr\nNew York, NY\nInternship\n"
+    "From June 1 to August 30\nUS work authorization required\nOPT/CPT accepted\n\nAbout\n"
+)
+
+
+def test_fill_at_a_glance_reads_block_fields():
+    jd = JobDetail(job_id="1", url="u", title="t")
+    _fill_at_a_glance(jd, BODY)
+
+    assert jd.pay_text == "$30–40/hr"
+    assert jd.location_text == "New York, NY"
+    assert jd.employment_type == "Internship"
+    assert jd.date_range_text == "From June 1 to August 30"
+    assert jd.work_auth_text == "US work authorization required"
+    assert jd.opt_cpt_text == "OPT/CPT accepted"
+
+
+def test_fill_at_a_glance_without_block_leaves_fields_empty():
+    jd = JobDetail(job_id="1", url="u", title="t")
+    _fill_at_a_glance(jd, "no glance section here")
+
+    assert jd.pay_text is None and jd.location_text is None